@@ -0,0 +1,166 @@
+"""Confidence and quiz trends for the Analytics page, computed on arrays.
+
+Only (date, confidence) and (date, score, total) are read, through narrow
+covering-index queries, and turned straight into NumPy arrays: dates are
+parsed once as datetime64[D], never row by row. On a daily calendar from the
+first to the last entry, everything else is vectorized pandas:
+
+- rolling 7- and 30-day means of confidence (days without a log are skipped,
+  not counted as zero)
+- a rolling 7-day mean of quiz scores, scaled to the 1-5 confidence range so
+  both can share one chart
+
+Weekly aggregates and the activity calendar aren't computed here at all:
+they come from the daily_rollup and weekly_rollup tables database.py keeps
+current on every write, so they cost a primary-key range read.
+
+Long histories are downsampled with LTTB (largest triangle three buckets)
+to at most MAX_POINTS rows before charting, which keeps the shape of the
+curve while a multi-year history still draws in a few hundred points.
+
+Results are memoized per database and write version (see
+database.write_version), so a rerun with nothing written reuses them.
+Returned frames are shared: don't modify them.
+"""
+import functools
+
+import numpy as np
+import pandas as pd
+
+import database as db
+
+MAX_POINTS = 500
+TREND_COLUMNS = ["7-day average", "30-day average", "Quiz score (7-day, out of 5)"]
+
+
+def lttb(x, y, n_out):
+    """Indices of the n_out points LTTB keeps from (x, y); x must be ascending.
+
+    The first and last points are always kept. The points in between are
+    split into n_out - 2 buckets, and from each bucket the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average is kept.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Bucket j is [edges[j], edges[j + 1]); the last "bucket" is the last point
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(np.int64), n)
+    sizes = np.diff(edges)
+    avg_x = np.add.reduceat(x, edges[:-1]) / sizes
+    avg_y = np.add.reduceat(y, edges[:-1]) / sizes
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - avg_x[i + 1]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (avg_y[i + 1] - ay))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def _arrays(rows, n_values):
+    """(datetime64[D] dates, float value columns...) from date-first rows."""
+    if not rows:
+        return (np.array([], dtype="datetime64[D]"),) + tuple(np.array([], dtype=float) for _ in range(n_values))
+    dates, *values = zip(*rows)
+    return (np.array(dates, dtype="datetime64[D]"),) + tuple(np.array(v, dtype=float) for v in values)
+
+
+@functools.lru_cache(maxsize=16)
+def _daily(path, version):
+    # path/version are the memo key only; the queries use the thread's database
+    log_dates, confidence = _arrays(db.get_confidence_history(), 1)
+    quiz_dates, score, total = _arrays(db.get_quiz_history(), 2)
+    if not len(log_dates) and not len(quiz_dates):
+        return pd.DataFrame(columns=["Confidence"] + TREND_COLUMNS + ["Quiz %"],
+                            index=pd.DatetimeIndex([], name="date"))
+
+    start = min(d[0] for d in (log_dates, quiz_dates) if len(d))
+    end = max(d[-1] for d in (log_dates, quiz_dates) if len(d))
+    calendar = pd.date_range(start, end, freq="D", name="date")
+    conf = pd.Series(confidence, index=pd.DatetimeIndex(log_dates)).reindex(calendar)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quiz_pct = pd.Series(np.where(total > 0, 100 * score / total, np.nan),
+                             index=pd.DatetimeIndex(quiz_dates)).reindex(calendar)
+    return pd.DataFrame({
+        "Confidence": conf,
+        TREND_COLUMNS[0]: conf.rolling(7, min_periods=1).mean(),
+        TREND_COLUMNS[1]: conf.rolling(30, min_periods=1).mean(),
+        TREND_COLUMNS[2]: (quiz_pct / 20).rolling(7, min_periods=1).mean(),
+        "Quiz %": quiz_pct,
+    })
+
+
+def daily():
+    """One row per calendar day: "Confidence", TREND_COLUMNS and "Quiz %" (NaN where there's no data)."""
+    return _daily(db.current_database(), db.write_version())
+
+
+@functools.lru_cache(maxsize=16)
+def _trend(path, version, max_points):
+    frame = _daily(path, version)[TREND_COLUMNS]
+    if len(frame) <= max_points:
+        return frame
+    # Pick the rows by the 7-day average, the line the chart is read by
+    primary = frame[TREND_COLUMNS[0]].ffill().bfill().fillna(0).to_numpy()
+    x = frame.index.to_numpy().astype("datetime64[D]").astype(np.int64)
+    return frame.iloc[lttb(x, primary, max_points)]
+
+
+def confidence_trend(max_points=MAX_POINTS):
+    """TREND_COLUMNS by date, downsampled to at most max_points rows for charting."""
+    return _trend(db.current_database(), db.write_version(), max_points)
+
+
+def weekly_summary():
+    """Per Monday-based week: logs, topics covered, average confidence, quizzes and average quiz %.
+
+    Weeks without activity between the first and the last are included, with zero counts.
+    """
+    rows = db.get_weekly_rollup()
+    if not rows:
+        return pd.DataFrame(columns=["Logs", "Topics", "Avg Confidence", "Quizzes", "Avg Quiz %"],
+                            index=pd.DatetimeIndex([], name="week"))
+    weeks, logs, topics, conf_sum, conf_count, quizzes, score, total = _arrays(rows, 7)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frame = pd.DataFrame({
+            "Logs": logs,
+            "Topics": topics,
+            "Avg Confidence": np.where(conf_count > 0, conf_sum / conf_count, np.nan),
+            "Quizzes": quizzes,
+            "Avg Quiz %": np.where(total > 0, 100 * score / total, np.nan),
+        }, index=pd.DatetimeIndex(weeks, name="week"))
+    # Not pd.date_range(freq="W-MON"): it builds anchored ranges one element at a time
+    calendar = pd.DatetimeIndex(np.arange(weeks[0], weeks[-1] + 1, 7), name="week")
+    return frame.reindex(calendar).fillna({"Logs": 0, "Topics": 0, "Quizzes": 0}).astype(
+        {"Logs": int, "Topics": int, "Quizzes": int})
+
+
+def activity_calendar(start_date, end_date):
+    """One row per day from start_date to end_date ('YYYY-MM-DD', inclusive) for the activity heatmap.
+
+    Columns: "Topics" and "Logged" (0 on days without a log), "Confidence"
+    and "Quiz %" (NaN without a log or quiz), plus "Week" (that week's
+    Monday, 'YYYY-MM-DD') and "Weekday" ("Mon" to "Sun").
+    """
+    dates, logged, topics, confidence, _, score, total = _arrays(db.get_daily_rollup(start_date, end_date), 6)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quiz_pct = np.where(total > 0, 100 * score / total, np.nan)
+    frame = pd.DataFrame({"Logged": logged, "Topics": topics, "Confidence": confidence, "Quiz %": quiz_pct},
+                         index=pd.DatetimeIndex(dates, name="date"))
+    calendar = pd.date_range(start_date, end_date, freq="D", name="date")
+    frame = frame.reindex(calendar).fillna({"Logged": 0, "Topics": 0}).astype({"Logged": int, "Topics": int})
+    days = calendar.to_numpy().astype("datetime64[D]")
+    frame["Week"] = np.datetime_as_string(days - calendar.dayofweek.to_numpy().astype("timedelta64[D]"))
+    frame["Weekday"] = calendar.strftime("%a")
+    return frame
+
+
+def clear_cache():
+    _daily.cache_clear()
+    _trend.cache_clear()
@@ -0,0 +1,252 @@
+"""Benchmarks for the storage and analytics layer.
+
+Seeds scratch databases of increasing size and times every public function
+in database.py, quiz generation, roadmap lookups and the data each app.py
+page loads (both straight from SQLite and served from the read cache). Results are printed as JSON lines (one per measurement) and can
+be saved and compared against an earlier run:
+
+    python benchmark.py --sizes 1000 100000 1000000 --out bench.json
+    python benchmark.py --sizes 1000 100000 --compare bench.json
+
+With --compare, exits non-zero if any measurement got slower than
+--threshold times its previous median.
+"""
+import argparse
+import datetime
+import inspect
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+import analytics
+import database as db
+import quiz_engine
+import roadmap
+import roadmap_index
+from query_plan_check import CALLS, public_functions, seed
+
+# database.py functions that write; everything else in CALLS only reads
+WRITE_PREFIXES = ("add_", "update_", "delete_", "set_", "toggle_", "save_", "clear_", "rebuild_")
+
+def page_loads():
+    """The database reads each app.py page makes on a render."""
+    def dashboard():
+        db.get_analytics_stats()
+        db.count_due_revisions("1900-03-06")
+        db.get_due_revisions("1900-03-06", 5)
+        db.get_recent_logs(3)
+
+    def log_progress():
+        date_str = "1900-03-06"
+        db.get_daily_log(date_str)
+        db.get_log_topics(date_str)
+        db.get_setting("roadmap_start_date")
+        db.get_topics_between("1900-03-01", "1900-03-05")
+        db.get_due_revisions(date_str, 10)
+
+    def daily_quiz():
+        db.get_setting("roadmap_start_date")
+        db.get_quiz_result("1900-03-06")
+        db.count_questions()
+
+    def goals():
+        db.get_setting("roadmap_start_date")
+        db.get_weekly_goals("1900-03-05")
+        logs = db.get_recent_logs(7)
+        db.get_topics_for_dates([log[0] for log in logs])
+
+    def projects():
+        db.get_setting("roadmap_start_date")
+        plan = roadmap_index.get()
+        db.get_roadmap_projects([(day, p["title"]) for day, p in plan.projects.items()], 60)
+
+    def analytics_page():
+        db.get_setting("roadmap_start_date")
+        analytics.activity_calendar("1899-03-06", "1900-03-06")
+        analytics.confidence_trend()
+        analytics.weekly_summary()
+        db.get_topic_coverage(roadmap_index.get().all_topics)
+        db.get_difficulty_stats()
+        db.get_weakest_topics(5)
+        db.get_hardest_questions(10)
+        for _ in db.iter_monthly_assessments(columns=("month_str", "reflection_text", "rating")):
+            pass
+
+    return {
+        "page:Dashboard": dashboard,
+        "page:Log Progress": log_progress,
+        "page:Daily Quiz": daily_quiz,
+        "page:Goals": goals,
+        "page:Projects": projects,
+        "page:Analytics": analytics_page,
+    }
+
+
+def roadmap_lookups():
+    plan = roadmap_index.get()
+
+    # Same lookups the Log Progress, Goals and Analytics pages do
+    def day_lookup():
+        for day_num in range(1, plan.total_days + 1):
+            plan.day(day_num)
+
+    def week_titles():
+        for week_num in range(1, plan.total_weeks + 1):
+            plan.week_title(week_num)
+
+    def topic_days():
+        for topic in plan.all_topics:
+            plan.days_for_topic(topic)
+
+    # Loading a plan at process start: from the pickle cache vs from scratch
+    def load_cached():
+        roadmap_index.compile_plan(plan.id)
+
+    def load_parsed():
+        roadmap_index.Plan(roadmap.load(plan.id))
+
+    return {
+        "roadmap:day lookups": day_lookup,
+        "roadmap:week titles": week_titles,
+        "roadmap:topic lookups": topic_days,
+        "roadmap:load cached plan": load_cached,
+        "roadmap:load and compile plan": load_parsed,
+    }
+
+
+def time_call(fn, min_time, max_runs):
+    """Runs fn until min_time seconds have passed (at least once); returns per-run seconds."""
+    runs = []
+    deadline = time.perf_counter() + min_time
+    while len(runs) < max_runs:
+        start = time.perf_counter()
+        result = fn()
+        if inspect.isgenerator(result):
+            for _ in result:
+                pass
+        runs.append(time.perf_counter() - start)
+        if time.perf_counter() >= deadline:
+            break
+    return runs
+
+
+def summarize(size, name, runs):
+    runs = sorted(runs)
+    return {
+        "size": size,
+        "name": name,
+        "runs": len(runs),
+        "median_us": round(statistics.median(runs) * 1e6, 1),
+        "p95_us": round(runs[min(len(runs) - 1, int(len(runs) * 0.95))] * 1e6, 1),
+        "min_us": round(runs[0] * 1e6, 1),
+    }
+
+
+def bench_size(size, tmp, min_time, max_runs):
+    db.close_all()
+    db.DB_NAME = os.path.join(tmp, f"bench_{size}.db")
+    db.init_db()
+    start = time.perf_counter()
+    seed(size)
+    yield {"size": size, "name": "seed", "runs": 1, "median_us": round((time.perf_counter() - start) * 1e6, 1)}
+
+    targets, writes = {}, {}
+    for name in public_functions():
+        if name in CALLS:
+            fn, args = getattr(db, name), CALLS[name]
+            (writes if name.startswith(WRITE_PREFIXES) else targets)[f"db:{name}"] = (lambda fn=fn, args=args: fn(*args))
+    plan = roadmap_index.get()
+    week_titles = [plan.week_title(w) for w in range(1, plan.total_weeks + 1)]
+    day_titles = [day.title for day in plan.days[1:]]
+    targets["quiz:generate_quiz"] = lambda: quiz_engine.generate_quiz("Linear Regression")
+    targets["quiz:generate_quiz seeded"] = lambda: quiz_engine.generate_quiz("Linear Regression", seed=1)
+    targets["quiz:generate_quizzes week titles"] = lambda: quiz_engine.generate_quizzes(week_titles, seed=1)
+    targets["quiz:generate_quizzes day titles"] = lambda: quiz_engine.generate_quizzes(day_titles, seed=1)
+    targets.update(roadmap_lookups())
+    # Trend computed from scratch (page:Analytics is served from the memo after its first run)
+    targets["analytics:confidence_trend"] = lambda: (analytics.clear_cache(), analytics.confidence_trend())
+    # Both read the rollup tables
+    targets["analytics:weekly_summary"] = analytics.weekly_summary
+    targets["analytics:activity_calendar"] = lambda: analytics.activity_calendar("1899-03-06", "1900-03-06")
+    targets.update(page_loads())
+
+    # Measured against SQLite; the read cache would turn every run after the first into a hit
+    db.READ_CACHE = False
+    for name, fn in targets.items():
+        yield summarize(size, name, time_call(fn, min_time, max_runs))
+
+    # What a Streamlit rerun with nothing changed costs
+    db.READ_CACHE = True
+    for name, fn in page_loads().items():
+        yield summarize(size, f"cached {name}", time_call(fn, min_time, max_runs))
+
+    # Writes last: some empty whole tables (delete_roadmap_goals() every
+    # seeded goal, clear_revision_queue() the queue), which would leave the
+    # reads and page loads above measuring next to nothing
+    db.READ_CACHE = False
+    for name, fn in writes.items():
+        yield summarize(size, name, time_call(fn, min_time, max_runs))
+    db.close_all()
+
+
+def compare(results, baseline_path, threshold):
+    with open(baseline_path) as f:
+        baseline = {(r["size"], r["name"]): r for r in map(json.loads, f) if "median_us" in r}
+    regressions = []
+    for r in results:
+        old = baseline.get((r["size"], r["name"]))
+        if not old or r["name"] == "seed" or not old["median_us"]:
+            continue
+        ratio = r["median_us"] / old["median_us"]
+        if ratio > threshold:
+            regressions.append(f'{r["name"]} @ {r["size"]}: {old["median_us"]} -> {r["median_us"]} us ({ratio:.2f}x)')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000],
+                        help="rows seeded per table")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to spend per measurement")
+    parser.add_argument("--max-runs", type=int, default=1000)
+    parser.add_argument("--out", help="also write the JSON lines to this file")
+    parser.add_argument("--compare", help="JSON lines file from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.5, help="slowdown ratio that counts as a regression")
+    args = parser.parse_args()
+
+    meta = {
+        "meta": True,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "when": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+    results = [meta]
+    print(json.dumps(meta))
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            for r in bench_size(size, tmp, args.min_time, args.max_runs):
+                results.append(r)
+                print(json.dumps(r), flush=True)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            for r in results:
+                f.write(json.dumps(r) + "\n")
+
+    if args.compare:
+        regressions = compare(results[1:], args.compare, args.threshold)
+        if regressions:
+            print("\nRegressions:", file=sys.stderr)
+            for line in regressions:
+                print(f"  - {line}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
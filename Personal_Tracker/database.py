@@ -1,13 +1,508 @@
 import sqlite3
+import atexit
 import datetime
+import json
+import functools
+import os
+import queue
+import random
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+import instrumentation
 
 DB_NAME = "tracker.db"
 
-def init_db():
-    """Initializes the database tables if they don't exist."""
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    
+# --- Learner Databases ---
+# One instance can serve several learners, each with their own SQLite file
+# under LEARNERS_DIR. Every function below works on the database selected for
+# the calling thread (app.py selects the session's learner at the top of each
+# run); threads that never select one use DB_NAME.
+LEARNERS_DIR = "learners"
+_LEARNER_ID = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+
+def learner_path(learner_id):
+    """The database file for a learner id (lowercase letters, digits, '-' and '_')."""
+    if not _LEARNER_ID.match(learner_id or ""):
+        raise ValueError(f"Invalid learner id: {learner_id!r}")
+    return os.path.join(LEARNERS_DIR, f"{learner_id}.db")
+
+
+def use_database(path):
+    """Selects the database file for this thread's calls (None: back to DB_NAME)."""
+    if getattr(_local, "conn", None) is not None:
+        raise RuntimeError("Can't switch databases while a connection is held")
+    _local.db_path = path
+
+
+def use_learner(learner_id):
+    """Selects a learner's database for this thread's calls (None: back to DB_NAME)."""
+    if learner_id is None:
+        use_database(None)
+        return
+    path = learner_path(learner_id)
+    os.makedirs(LEARNERS_DIR, exist_ok=True)
+    use_database(path)
+
+
+def current_database():
+    return getattr(_local, "db_path", None) or DB_NAME
+
+
+# --- Connection Manager ---
+# A Streamlit rerun calls many of the functions below. Instead of opening a
+# fresh sqlite3 connection for every call, connections are kept in a small
+# pool per database file and a thread reuses the one it already holds.
+# Past MAX_IDLE_CONNECTIONS idle connections in all, the pools of the least
+# recently used files are closed, so open files stay bounded however many
+# learner databases there are.
+POOL_SIZE = 8
+MAX_IDLE_CONNECTIONS = 256
+STATEMENT_CACHE_SIZE = 256
+
+# Storage profile applied to every new connection. WAL lets readers (Dashboard,
+# Analytics) keep reading while a writer (Log Progress, Goals) commits.
+STORAGE_PROFILE = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",   # safe with WAL, avoids an fsync per commit
+    "cache_size": -16000,      # negative = KiB, i.e. ~16 MB page cache
+    "mmap_size": 268435456,    # 256 MB memory-mapped reads
+    "temp_store": "MEMORY",
+}
+BUSY_TIMEOUT = 5.0   # seconds SQLite waits for a lock before giving up
+WRITE_RETRIES = 5    # extra attempts to start a write transaction after that
+
+_pool_lock = threading.Lock()
+_pools = OrderedDict()  # db path -> list of idle connections, least recently used first
+_idle_count = 0  # idle connections across all pools
+_local = threading.local()
+
+
+def _connect(path):
+    # isolation_level=None: transactions are managed explicitly by transaction()
+    conn = sqlite3.connect(
+        path,
+        timeout=BUSY_TIMEOUT,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        factory=_connection_class(),
+    )
+    for pragma, value in STORAGE_PROFILE.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    return conn
+
+
+def _begin_write(conn):
+    # BEGIN IMMEDIATE takes the write lock up front, so a writer waits on the
+    # busy timeout instead of failing halfway through when it upgrades a read
+    # lock. If the lock is still held after that, back off and try again.
+    for attempt in range(WRITE_RETRIES + 1):
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            return
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e) and "busy" not in str(e):
+                raise
+            if attempt == WRITE_RETRIES:
+                raise
+            time.sleep(0.05 * 2 ** attempt)
+
+
+def _acquire(path):
+    global _idle_count
+    with _pool_lock:
+        idle = _pools.get(path)
+        if idle is not None:
+            _pools.move_to_end(path)
+            if idle:
+                _idle_count -= 1
+                return idle.pop()
+    return _connect(path)
+
+
+def _release(path, conn):
+    global _idle_count
+    if conn.in_transaction:
+        conn.rollback()
+    retired = [conn]
+    with _pool_lock:
+        idle = _pools.setdefault(path, [])
+        _pools.move_to_end(path)
+        # Connections opened before tracing was switched on/off are retired
+        if len(idle) < POOL_SIZE and type(conn) is _connection_class():
+            idle.append(conn)
+            _idle_count += 1
+            retired = []
+        while _idle_count > MAX_IDLE_CONNECTIONS:
+            oldest = _pools.popitem(last=False)[1]
+            _idle_count -= len(oldest)
+            retired += oldest
+    for old in retired:
+        old.close()
+
+
+@contextmanager
+def connection():
+    """Yields this thread's connection, checking one out of the pool if needed.
+
+    Nested uses share the same connection, so wrapping a whole page render in
+    `with db.connection():` makes every query in it use a single connection.
+    """
+    held = getattr(_local, "conn", None)
+    if held is not None:
+        yield held
+        return
+    path = current_database()
+    _await_writes(path)
+    conn = _acquire(path)
+    _local.conn = conn
+    _local.path = path
+    _local.depth = 0
+    try:
+        yield conn
+    finally:
+        _local.conn = None
+        _release(path, conn)
+
+
+@contextmanager
+def transaction():
+    """Runs the block in a single transaction (commit on success, rollback on error).
+
+    Nested transactions join the outermost one.
+    """
+    with connection() as conn:
+        if _local.depth == 0:
+            _begin_write(conn)
+        _local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            _local.depth -= 1
+            if _local.depth == 0:
+                conn.rollback()
+            raise
+        _local.depth -= 1
+        if _local.depth == 0:
+            conn.commit()
+            _bump_write_version(_local.path)
+
+
+def close_all():
+    """Closes every pooled connection (e.g. before deleting the database file)."""
+    global _idle_count
+    _await_all_writes()
+    with _pool_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        _idle_count = 0
+        _migrated.clear()
+    clear_read_cache()
+    for idle in pools:
+        for conn in idle:
+            conn.close()
+
+
+# --- Read Cache ---
+# Streamlit reruns the whole script on every widget interaction, so the same
+# getters run again and again with nothing changed in between. Getters marked
+# @_cached keep their last result per (db path, function, arguments) and tag
+# it with the database's write version, which every committed transaction
+# bumps. A result is only reused while the version is unchanged, so a write
+# is visible on the very next read. Only writes made through this module
+# (i.e. this process) are seen; cached results must not be mutated.
+READ_CACHE = True
+READ_CACHE_SIZE = 512  # entries, least recently used evicted first
+
+_cache_lock = threading.Lock()
+_read_cache = OrderedDict()  # (path, function name, args) -> (write version, result)
+_write_versions = {}  # db path -> number of committed transactions seen
+
+
+def _bump_write_version(path):
+    with _cache_lock:
+        _write_versions[path] = _write_versions.get(path, 0) + 1
+
+
+def write_version(path=None):
+    """The write version of `path` (default: this thread's database); changes after every commit."""
+    return _write_versions.get(path or current_database(), 0)
+
+
+def clear_read_cache():
+    with _cache_lock:
+        _read_cache.clear()
+
+
+def _cache_key(args):
+    # Lists (e.g. of dates) are turned into tuples so they can be hashed
+    return tuple(tuple(a) if isinstance(a, (list, set, frozenset)) else a for a in args)
+
+
+def _cached(fn):
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        # Inside a transaction the caller may be reading its own uncommitted writes
+        if not READ_CACHE or getattr(_local, "depth", 0):
+            return fn(*args, **kwargs)
+        path = current_database()
+        try:
+            key = (path, name, _cache_key(args), _cache_key(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return fn(*args, **kwargs)
+        _await_writes(path)
+        # Read the version before querying: a write that lands while we query
+        # leaves this entry tagged with the older version, so it's never reused.
+        version = _write_versions.get(path, 0)
+        with _cache_lock:
+            hit = _read_cache.get(key)
+            if hit is not None and hit[0] == version:
+                _read_cache.move_to_end(key)
+                return hit[1]
+        result = fn(*args, **kwargs)
+        with _cache_lock:
+            _read_cache[key] = (version, result)
+            _read_cache.move_to_end(key)
+            while len(_read_cache) > READ_CACHE_SIZE:
+                _read_cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+# --- Write-Behind Queue ---
+# Small UI writes (ticking a goal, updating a project) are handed to one
+# writer thread with defer() instead of each opening its own transaction.
+# The writer drains whatever has queued up and applies it per database file
+# in a single transaction, so a burst of clicks from many sessions costs one
+# commit rather than one each. A thread's reads (and synchronous writes) of
+# a database first wait for the deferred writes that same thread queued for
+# it, so whoever wrote always reads their own writes, and a deferred write
+# that failed is raised there, by that thread's next read of its database.
+# Other threads (other sessions) neither wait for those writes nor see their
+# errors. Pending writes are flushed at exit.
+WRITE_BEHIND = True
+WRITE_BATCH = 256  # most queued writes applied in one transaction
+WRITE_QUEUE_LIMIT = 4096  # defer() waits while this many writes are queued
+
+_write_queue = queue.Queue()
+_write_cond = threading.Condition()
+_queued = {}  # db path -> sequence number of the last write queued
+_applied = {}  # db path -> sequence number of the last write applied
+_write_errors = {}  # (session, db path) -> deferred writes that failed, not yet raised
+_writer = None
+
+
+def _session():
+    # Identifies the thread that queued a write, so its errors come back to it
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = object()
+        _local.pending = {}  # db path -> sequence number of this thread's last queued write
+    return session
+
+
+def defer(fn, *args, **kwargs):
+    """Queues a call to one of this module's write functions, e.g. defer(toggle_goal_complete, 3, 0).
+
+    Runs it right away instead inside a transaction (so it joins it) or with
+    WRITE_BEHIND off. If the write fails, the error is raised by this
+    thread's next read (or write) of the same database, usually the rerun
+    of the page that queued it.
+    """
+    global _writer
+    if not WRITE_BEHIND or getattr(_local, "depth", 0) or getattr(_local, "is_writer", False):
+        fn(*args, **kwargs)
+        return
+    path = current_database()
+    session = _session()
+    with _write_cond:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_write_loop, name="db-writer", daemon=True)
+            _writer.start()
+        _write_cond.wait_for(lambda: _write_queue.qsize() < WRITE_QUEUE_LIMIT)
+        seq = _queued[path] = _queued.get(path, 0) + 1
+        _write_queue.put((path, seq, session, fn, args, kwargs))
+    _local.pending[path] = seq
+
+
+def _await_writes(path):
+    seq = getattr(_local, "pending", {}).pop(path, None)
+    if seq is None:
+        return
+    with _write_cond:
+        _write_cond.wait_for(lambda: _applied.get(path, 0) >= seq)
+        errors = _write_errors.pop((_local.session, path), None)
+    if errors:
+        raise errors[0]
+
+
+def _await_all_writes():
+    if not getattr(_local, "is_writer", False):
+        with _write_cond:
+            _write_cond.wait_for(lambda: _queued == _applied)
+
+
+def flush():
+    """Waits until every deferred write has been applied; raises the first one that failed and wasn't raised yet."""
+    _await_all_writes()
+    with _write_cond:
+        errors = [e for session_errors in _write_errors.values() for e in session_errors]
+        _write_errors.clear()
+    if errors:
+        raise errors[0]
+
+
+def _write_failed(path, write, error):
+    with _write_cond:
+        _write_errors.setdefault((write[1], path), []).append(error)
+
+
+def _apply(path, writes):
+    use_database(path)
+    try:
+        start = time.perf_counter()
+        with transaction():
+            for _, _, fn, args, kwargs in writes:
+                fn(*args, **kwargs)
+        if instrumentation.ENABLED:
+            instrumentation.record("write", "group commit", time.perf_counter() - start, len(writes))
+    except Exception:
+        if len(writes) == 1:
+            raise
+        # Don't let one bad write take the rest of the group down with it
+        for write in writes:
+            try:
+                _apply(path, [write])
+            except Exception as e:
+                _write_failed(path, write, e)
+    finally:
+        use_database(None)
+
+
+def _write_loop():
+    _local.is_writer = True
+    while True:
+        batch = [_write_queue.get()]
+        while len(batch) < WRITE_BATCH:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        by_path = {}
+        for path, *write in batch:
+            by_path.setdefault(path, []).append(write)
+        for path, writes in by_path.items():
+            try:
+                _apply(path, writes)
+            except Exception as e:
+                # Only a lone write gets here; a group retries its writes one by one
+                _write_failed(path, writes[0], e)
+            with _write_cond:
+                _applied[path] = writes[-1][0]
+                _write_cond.notify_all()
+
+
+atexit.register(flush)
+
+
+# --- Query Tracing ---
+# When instrumentation is enabled, new connections are _TracedConnection:
+# every statement is recorded with its latency and row count. When it's off,
+# plain sqlite3.Connection objects are used, so tracing costs nothing.
+
+class _TracedCursor(sqlite3.Cursor):
+    _trace = None
+
+    def _timed(self, method, *args):
+        start = time.perf_counter()
+        result = method(*args)
+        elapsed = time.perf_counter() - start
+        return result, elapsed
+
+    def execute(self, sql, parameters=()):
+        _, elapsed = self._timed(super().execute, sql, parameters)
+        rows = self.rowcount if self.rowcount >= 0 else 0
+        self._trace = instrumentation.record("query", " ".join(sql.split()), elapsed, rows)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        _, elapsed = self._timed(super().executemany, sql, seq_of_parameters)
+        self._trace = instrumentation.record("query", " ".join(sql.split()), elapsed, max(self.rowcount, 0))
+        return self
+
+    def _fetched(self, rows, elapsed):
+        # Reading rows is part of a SELECT's cost; add it to the execute record
+        if self._trace is not None:
+            self._trace["ms"] += elapsed * 1000
+            self._trace["rows"] += rows
+
+    def fetchone(self):
+        row, elapsed = self._timed(super().fetchone)
+        self._fetched(row is not None, elapsed)
+        return row
+
+    def fetchmany(self, size=None):
+        rows, elapsed = self._timed(super().fetchmany, size or self.arraysize)
+        self._fetched(len(rows), elapsed)
+        return rows
+
+    def fetchall(self):
+        rows, elapsed = self._timed(super().fetchall)
+        self._fetched(len(rows), elapsed)
+        return rows
+
+    def __next__(self):
+        row, elapsed = self._timed(super().__next__)
+        self._fetched(1, elapsed)
+        return row
+
+
+class _TracedConnection(sqlite3.Connection):
+    def cursor(self, factory=_TracedCursor):
+        return super().cursor(factory)
+
+    # sqlite3.Connection.execute* would bypass the cursor subclass's methods
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def _connection_class():
+    return _TracedConnection if instrumentation.ENABLED else sqlite3.Connection
+
+
+def set_tracing(enabled, jsonl_path=None):
+    """Switches query/page tracing on or off for the whole process."""
+    if enabled:
+        instrumentation.enable(jsonl_path)
+    else:
+        instrumentation.disable()
+    close_all()  # idle connections are reopened with the matching class
+
+
+# --- Schema Migrations ---
+# Each step runs exactly once, in order, inside its own transaction, and
+# PRAGMA user_version records how many steps a database file has applied.
+# To change the schema, append a new step to MIGRATIONS; never edit old ones.
+
+def _add_column(c, table, column, decl):
+    columns = [row[1] for row in c.execute(f'PRAGMA table_info({table})')]
+    if column not in columns:
+        c.execute(f'ALTER TABLE {table} ADD COLUMN {column} {decl}')
+
+
+def _migration_base_schema(c):
     # Daily Logs
     c.execute('''
         CREATE TABLE IF NOT EXISTS daily_logs (
@@ -20,13 +515,9 @@ def init_db():
             revision_notes TEXT
         )
     ''')
-    
-    # Migration for existing tables
-    try:
-        c.execute('ALTER TABLE daily_logs ADD COLUMN topics_covered TEXT')
-        c.execute('ALTER TABLE daily_logs ADD COLUMN revision_notes TEXT')
-    except sqlite3.OperationalError:
-        pass # Columns already exist
+    # Databases created before these columns existed
+    _add_column(c, 'daily_logs', 'topics_covered', 'TEXT')
+    _add_column(c, 'daily_logs', 'revision_notes', 'TEXT')
     
     # Weekly Goals
     c.execute('''
@@ -51,12 +542,7 @@ def init_db():
             roadmap_project_day INTEGER
         )
     ''')
-    
-    # Migration for new column
-    try:
-        c.execute('ALTER TABLE projects ADD COLUMN roadmap_project_day INTEGER')
-    except sqlite3.OperationalError:
-        pass
+    _add_column(c, 'projects', 'roadmap_project_day', 'INTEGER')
     
     # Settings
     c.execute('''
@@ -77,7 +563,7 @@ def init_db():
         )
     ''')
     
-    # NEW: Quiz Results
+    # Quiz Results
     c.execute('''
         CREATE TABLE IF NOT EXISTS quiz_results (
             date TEXT PRIMARY KEY,
@@ -87,215 +573,1118 @@ def init_db():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
-    
-    conn.commit()
-    conn.close()
+
+
+def _migration_unique_weekly_goals(c):
+    # "Generate/Reset Roadmap" used to insert every goal again. Collapse the
+    # duplicates (keeping the oldest row, completed if any copy was) so the
+    # (week, goal) pair can be unique.
+    c.execute('''
+        UPDATE weekly_goals SET is_completed = 1 WHERE id IN (
+            SELECT MIN(id) FROM weekly_goals
+            GROUP BY week_start_date, goal_text
+            HAVING COUNT(*) > 1 AND MAX(is_completed)
+        )
+    ''')
+    c.execute('''
+        DELETE FROM weekly_goals WHERE id NOT IN (
+            SELECT MIN(id) FROM weekly_goals GROUP BY week_start_date, goal_text
+        )
+    ''')
+    c.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_weekly_goals_week_goal
+        ON weekly_goals (week_start_date, goal_text)
+    ''')
+
+
+def _migration_secondary_indexes(c):
+    # Chosen for the queries below; query_plan_check.py verifies none of
+    # them falls back to a full table scan. weekly_goals lookups by week
+    # already use the (week_start_date, goal_text) unique index.
+    c.execute('CREATE INDEX IF NOT EXISTS idx_projects_status ON projects (status)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_projects_created_at ON projects (created_at)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_monthly_assessments_month ON monthly_assessments (month_str)')
+    # Lets AVG(confidence_score) read a narrow index instead of every log's text
+    c.execute('CREATE INDEX IF NOT EXISTS idx_daily_logs_confidence ON daily_logs (confidence_score)')
+
+
+def _migration_learner_stats(c):
+    # Single-row summary kept current by the write path (see _bump_log_stats
+    # and _bump_projects_done), so the Dashboard never aggregates daily_logs.
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS learner_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_logs INTEGER NOT NULL DEFAULT 0,
+            confidence_sum INTEGER NOT NULL DEFAULT 0,
+            confidence_count INTEGER NOT NULL DEFAULT 0,
+            projects_done INTEGER NOT NULL DEFAULT 0,
+            last_log_date TEXT,
+            streak INTEGER NOT NULL DEFAULT 0, -- consecutive days ending at last_log_date
+            longest_streak INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    _rebuild_stats(c)
+
+
+def _migration_log_topics(c):
+    # One row per (day, topic) instead of a JSON list per log, so coverage
+    # questions are grouped SQL. Keyed on position so a day's topics come
+    # back in roadmap order straight from the primary key.
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS log_topics (
+            date TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            topic TEXT NOT NULL,
+            PRIMARY KEY (date, position)
+        ) WITHOUT ROWID
+    ''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_log_topics_topic ON log_topics (topic, date)')
+    c.execute('''
+        INSERT INTO log_topics (date, position, topic)
+        SELECT d.date, MIN(j.key), j.value
+        FROM daily_logs d, json_each(d.topics_covered) j
+        WHERE json_valid(d.topics_covered) AND json_type(d.topics_covered) = 'array' AND j.type = 'text'
+        GROUP BY d.date, j.value
+    ''')
+
+
+def _migration_goal_day_num(c):
+    # Roadmap goals are "Day X: Title"; store X so the Goals page doesn't
+    # parse it back out of the text. Custom goals keep NULL.
+    _add_column(c, 'weekly_goals', 'day_num', 'INTEGER')
+    c.execute('''
+        UPDATE weekly_goals
+        SET day_num = CAST(substr(goal_text, 5, instr(goal_text, ':') - 5) AS INTEGER)
+        WHERE goal_text GLOB 'Day [0-9]*:*'
+    ''')
+
+
+def _migration_goal_day_num_index(c):
+    # Only roadmap goals have a day number; lets switching plans find them
+    c.execute('CREATE INDEX IF NOT EXISTS idx_weekly_goals_day_num ON weekly_goals (day_num) WHERE day_num IS NOT NULL')
+
+
+def _migration_question_bank(c):
+    # Generated and curated quiz questions. Quizzes draw from it by
+    # (topic, difficulty); question_bank_fts is an external-content FTS5
+    # index over the text, kept in sync by the triggers below.
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS question_bank (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            topic TEXT NOT NULL,
+            difficulty TEXT NOT NULL, -- 'Easy', 'Medium', 'Hard'
+            question TEXT NOT NULL,
+            options TEXT NOT NULL, -- JSON list, in display order
+            answer TEXT NOT NULL,
+            tags TEXT NOT NULL DEFAULT '', -- space-separated
+            source TEXT NOT NULL DEFAULT 'generated', -- 'generated' or 'curated'
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (topic, question)
+        )
+    ''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_question_bank_topic_difficulty ON question_bank (topic, difficulty)')
+    c.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS question_bank_fts USING fts5(
+            question, topic, tags, content='question_bank', content_rowid='id', tokenize='porter unicode61'
+        )
+    ''')
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS question_bank_ai AFTER INSERT ON question_bank BEGIN
+            INSERT INTO question_bank_fts (rowid, question, topic, tags) VALUES (new.id, new.question, new.topic, new.tags);
+        END
+    ''')
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS question_bank_ad AFTER DELETE ON question_bank BEGIN
+            INSERT INTO question_bank_fts (question_bank_fts, rowid, question, topic, tags)
+            VALUES ('delete', old.id, old.question, old.topic, old.tags);
+        END
+    ''')
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS question_bank_au AFTER UPDATE ON question_bank BEGIN
+            INSERT INTO question_bank_fts (question_bank_fts, rowid, question, topic, tags)
+            VALUES ('delete', old.id, old.question, old.topic, old.tags);
+            INSERT INTO question_bank_fts (rowid, question, topic, tags) VALUES (new.id, new.question, new.topic, new.tags);
+        END
+    ''')
+
+
+def _migration_quiz_answers(c):
+    # One row per answered question, plus running totals per question,
+    # difficulty and topic that the write path keeps current (see
+    # _bump_quiz_stats), so item analysis never aggregates quiz_answers.
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS quiz_answers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL, -- the quiz_results date it belongs to
+            question_id INTEGER, -- question_bank.id, NULL if it wasn't banked
+            topic TEXT NOT NULL,
+            difficulty TEXT NOT NULL,
+            chosen TEXT,
+            is_correct INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_quiz_answers_date ON quiz_answers (date)')
+    for table, key in (('question_stats', 'question_id INTEGER'), ('difficulty_stats', 'difficulty TEXT'),
+                       ('topic_stats', 'topic TEXT')):
+        c.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                {key} PRIMARY KEY,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                correct INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        ''')
+    # "Hardest question" / "weakest topic" lists read these in order
+    c.execute('CREATE INDEX IF NOT EXISTS idx_question_stats_accuracy ON question_stats (correct * 1.0 / attempts)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_topic_stats_accuracy ON topic_stats (correct * 1.0 / attempts)')
+
+
+def _migration_revision_queue(c):
+    # Spaced-repetition state per topic (see spaced_repetition.py). The
+    # prev_* columns hold the state from before the last review, so a second
+    # review on the same day can be recomputed instead of compounding.
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS revision_queue (
+            topic TEXT PRIMARY KEY,
+            ease REAL NOT NULL,
+            interval_days INTEGER NOT NULL,
+            repetitions INTEGER NOT NULL,
+            due_date TEXT NOT NULL,
+            last_review TEXT,
+            last_quality INTEGER,
+            prev_ease REAL,
+            prev_interval_days INTEGER,
+            prev_repetitions INTEGER,
+            prev_due_date TEXT
+        ) WITHOUT ROWID
+    ''')
+    # Due topics come off this index in due-date order
+    c.execute('CREATE INDEX IF NOT EXISTS idx_revision_queue_due ON revision_queue (due_date)')
+
+
+def _migration_unique_project_day(c):
+    # One tracked project per roadmap day. The Projects page showed the newest
+    # of any duplicates, so that one keeps the day; older copies stay as
+    # custom projects rather than being deleted.
+    c.execute('''
+        UPDATE projects SET roadmap_project_day = NULL
+        WHERE roadmap_project_day IS NOT NULL AND id NOT IN (
+            SELECT MAX(id) FROM projects WHERE roadmap_project_day IS NOT NULL GROUP BY roadmap_project_day
+        )
+    ''')
+    c.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_projects_roadmap_day
+        ON projects (roadmap_project_day) WHERE roadmap_project_day IS NOT NULL
+    ''')
+    # Projects from before roadmap_project_day existed are matched by name
+    c.execute('CREATE INDEX IF NOT EXISTS idx_projects_legacy_name ON projects (name) WHERE roadmap_project_day IS NULL')
+
+
+def _migration_analytics_indexes(c):
+    # Covering indexes for the date-ordered pulls in analytics.py, so a long
+    # history is read from narrow index pages rather than the full rows
+    c.execute('CREATE INDEX IF NOT EXISTS idx_daily_logs_date_confidence ON daily_logs (date, confidence_score)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_quiz_results_date_score ON quiz_results (date, score, total_questions)')
+
+
+def _migration_activity_rollups(c):
+    # Per-day and per-week activity totals kept current by the write path
+    # (see _refresh_rollups), so the activity heatmap and weekly summary read
+    # a few rows by primary key instead of every log and quiz.
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS daily_rollup (
+            date TEXT PRIMARY KEY,
+            logged INTEGER NOT NULL DEFAULT 0,
+            topics INTEGER NOT NULL DEFAULT 0,
+            confidence INTEGER,
+            quizzed INTEGER NOT NULL DEFAULT 0,
+            quiz_score INTEGER,
+            quiz_total INTEGER
+        ) WITHOUT ROWID
+    ''')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS weekly_rollup (
+            week_start TEXT PRIMARY KEY, -- the Monday
+            days_logged INTEGER NOT NULL,
+            topics INTEGER NOT NULL,
+            confidence_sum INTEGER NOT NULL,
+            confidence_count INTEGER NOT NULL,
+            quizzes INTEGER NOT NULL,
+            quiz_score INTEGER NOT NULL,
+            quiz_total INTEGER NOT NULL
+        ) WITHOUT ROWID
+    ''')
+    _rebuild_rollups(c)
+
+
+def _migration_unique_goal_day(c):
+    # Roadmap goals are keyed on their day, so regenerating with a new start
+    # date moves them instead of adding a second set. Earlier resets left
+    # one copy per start date: keep the newest, completed if any copy was.
+    c.execute('''
+        UPDATE weekly_goals SET is_completed = 1 WHERE id IN (
+            SELECT MAX(id) FROM weekly_goals WHERE day_num IS NOT NULL
+            GROUP BY day_num HAVING COUNT(*) > 1 AND MAX(is_completed)
+        )
+    ''')
+    c.execute('''
+        DELETE FROM weekly_goals WHERE day_num IS NOT NULL AND id NOT IN (
+            SELECT MAX(id) FROM weekly_goals WHERE day_num IS NOT NULL GROUP BY day_num
+        )
+    ''')
+    # Replaces the plain index from migration 7
+    c.execute('DROP INDEX IF EXISTS idx_weekly_goals_day_num')
+    c.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_weekly_goals_day ON weekly_goals (day_num) WHERE day_num IS NOT NULL')
+
+
+def _migration_quiz_topic_index(c):
+    # Replaying one topic's revision history (spaced_repetition.py) reads the
+    # quizzes of its weeks by title
+    c.execute('''
+        CREATE INDEX IF NOT EXISTS idx_quiz_results_topic
+        ON quiz_results (topic_covered, date, score, total_questions)
+    ''')
+
+
+MIGRATIONS = [
+    _migration_base_schema,  # 1
+    _migration_unique_weekly_goals,  # 2
+    _migration_secondary_indexes,  # 3
+    _migration_learner_stats,  # 4
+    _migration_log_topics,  # 5
+    _migration_goal_day_num,  # 6
+    _migration_goal_day_num_index,  # 7
+    _migration_question_bank,  # 8
+    _migration_quiz_answers,  # 9
+    _migration_revision_queue,  # 10
+    _migration_unique_project_day,  # 11
+    _migration_analytics_indexes,  # 12
+    _migration_activity_rollups,  # 13
+    _migration_unique_goal_day,  # 14
+    _migration_quiz_topic_index,  # 15
+]
+
+_migrate_lock = threading.Lock()
+_migrated = set()  # db paths already at len(MIGRATIONS) in this process
+
+
+def schema_version():
+    with connection() as conn:
+        return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def init_db():
+    """Brings the database schema up to date.
+
+    Cheap to call on every Streamlit rerun: once a database file has been
+    migrated in this process, it returns without touching SQLite.
+    """
+    path = current_database()
+    if path in _migrated:
+        return
+    with _migrate_lock:
+        if path in _migrated:
+            return
+        with connection() as conn:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for target in range(version + 1, len(MIGRATIONS) + 1):
+                with transaction():
+                    # Re-read inside the write lock: another process may have
+                    # applied this step since we looked.
+                    version = conn.execute('PRAGMA user_version').fetchone()[0]
+                    if version >= target:
+                        continue
+                    MIGRATIONS[target - 1](conn.cursor())
+                    conn.execute(f'PRAGMA user_version = {target}')
+        _migrated.add(path)
+
 
 # --- Daily Logs ---
 def add_daily_log(date, topics, revision, confidence):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    # Support both old and new columns for backward compatibility logic if needed, 
-    # but primarily we populate the new ones. 
-    # specific logic: We will store topics in topics_covered and revision in revision_notes.
-    # We leave planned_tasks/actual_learning as empty or legacy copies if desired.
-    c.execute('''
-        INSERT OR REPLACE INTO daily_logs (date, topics_covered, revision_notes, confidence_score)
-        VALUES (?, ?, ?, ?)
-    ''', (date, topics, revision, confidence))
-    conn.commit()
-    conn.close()
+    """Saves the day's log. `topics` is the list of roadmap topics covered."""
+    if isinstance(topics, str):
+        topics = json.loads(topics)  # older callers passed the JSON text
+    topics = list(dict.fromkeys(topics))  # drop repeats, keep order
+    with transaction() as conn:
+        # Support both old and new columns for backward compatibility logic if needed, 
+        # but primarily we populate the new ones. 
+        # specific logic: topics go to log_topics (one row each); the JSON copy in
+        # topics_covered is kept for older readers. Revision goes in revision_notes.
+        # We leave planned_tasks/actual_learning as empty or legacy copies if desired.
+        c = conn.cursor()
+        previous = c.execute('SELECT confidence_score FROM daily_logs WHERE date = ?', (date,)).fetchone()
+        c.execute('''
+            INSERT OR REPLACE INTO daily_logs (date, topics_covered, revision_notes, confidence_score)
+            VALUES (?, ?, ?, ?)
+        ''', (date, json.dumps(topics), revision, confidence))
+        c.execute('DELETE FROM log_topics WHERE date = ?', (date,))
+        c.executemany('INSERT INTO log_topics (date, position, topic) VALUES (?, ?, ?)',
+                      ((date, i, topic) for i, topic in enumerate(topics)))
+        _bump_log_stats(c, date, previous, confidence)
+        _refresh_rollups(c, date, date)
 
+@_cached
 def get_daily_log(date):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('SELECT * FROM daily_logs WHERE date = ?', (date,))
-    data = c.fetchone()
-    conn.close()
-    return data
+    with connection() as conn:
+        return conn.execute('SELECT * FROM daily_logs WHERE date = ?', (date,)).fetchone()
 
+@_cached
 def get_all_logs():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('SELECT * FROM daily_logs ORDER BY date DESC')
-    data = c.fetchall()
-    conn.close()
-    return data
+    with connection() as conn:
+        return conn.execute('SELECT * FROM daily_logs ORDER BY date DESC').fetchall()
+
+# Windowed lookups: cost depends on the size of the window, not the history.
+@_cached
+def get_recent_logs(n):
+    with connection() as conn:
+        return conn.execute('SELECT * FROM daily_logs ORDER BY date DESC LIMIT ?', (n,)).fetchall()
+
+@_cached
+def get_logs_between(start_date, end_date):
+    """Logs with start_date <= date <= end_date (inclusive, 'YYYY-MM-DD'), newest first."""
+    with connection() as conn:
+        return conn.execute(
+            'SELECT * FROM daily_logs WHERE date BETWEEN ? AND ? ORDER BY date DESC',
+            (start_date, end_date)).fetchall()
+
+@_cached
+def get_logs_for_dates(dates):
+    dates = list(dates)
+    if not dates:
+        return []
+    placeholders = ", ".join("?" * len(dates))
+    with connection() as conn:
+        return conn.execute(
+            f'SELECT * FROM daily_logs WHERE date IN ({placeholders}) ORDER BY date DESC',
+            dates).fetchall()
+
+# --- Log Topics ---
+@_cached
+def get_log_topics(date):
+    with connection() as conn:
+        rows = conn.execute('SELECT topic FROM log_topics WHERE date = ? ORDER BY position', (date,))
+        return [row[0] for row in rows]
+
+@_cached
+def get_topics_for_dates(dates):
+    """Returns {date: [topics in roadmap order]} for the given dates."""
+    dates = list(dates)
+    if not dates:
+        return {}
+    placeholders = ", ".join("?" * len(dates))
+    topics = {}
+    with connection() as conn:
+        rows = conn.execute(
+            f'SELECT date, topic FROM log_topics WHERE date IN ({placeholders}) ORDER BY date, position',
+            dates)
+        for date, topic in rows:
+            topics.setdefault(date, []).append(topic)
+    return topics
+
+@_cached
+def get_topics_between(start_date, end_date):
+    """Distinct topics logged with start_date <= date <= end_date, in the order first logged."""
+    with connection() as conn:
+        rows = conn.execute(
+            'SELECT topic FROM log_topics WHERE date BETWEEN ? AND ? ORDER BY date, position',
+            (start_date, end_date))
+        return list(dict.fromkeys(row[0] for row in rows))
+
+@_cached
+def get_topic_coverage(topics=None):
+    """Returns (topic, times_covered, first_date, last_date) rows, one per topic.
+
+    Pass `topics` (e.g. every topic in the roadmap) to restrict the result to them.
+    """
+    sql = 'SELECT topic, COUNT(*), MIN(date), MAX(date) FROM log_topics'
+    params = []
+    if topics is not None:
+        params = list(dict.fromkeys(topics))
+        if not params:
+            return []
+        sql += f' WHERE topic IN ({", ".join("?" * len(params))})'
+    sql += ' GROUP BY topic'
+    with connection() as conn:
+        return conn.execute(sql, params).fetchall()
 
 # --- Weekly Goals ---
-def add_weekly_goal(week_date, goal_text):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('INSERT INTO weekly_goals (week_start_date, goal_text, is_completed) VALUES (?, ?, 0)', (week_date, goal_text))
-    conn.commit()
-    conn.close()
+# Roadmap goals are matched on their day (moving to the new week and text if
+# those changed), custom goals on (week, text)
+_UPSERT_WEEKLY_GOAL = '''
+    INSERT INTO weekly_goals (week_start_date, goal_text, is_completed, day_num) VALUES (?, ?, 0, ?)
+    ON CONFLICT (day_num) WHERE day_num IS NOT NULL DO UPDATE SET
+        week_start_date = excluded.week_start_date, goal_text = excluded.goal_text
+    WHERE week_start_date IS NOT excluded.week_start_date OR goal_text IS NOT excluded.goal_text
+    ON CONFLICT (week_start_date, goal_text) DO UPDATE SET day_num = excluded.day_num
+    WHERE day_num IS NOT excluded.day_num
+'''
+
+def add_weekly_goal(week_date, goal_text, day_num=None):
+    with transaction() as conn:
+        conn.execute(_UPSERT_WEEKLY_GOAL, (week_date, goal_text, day_num))
+
+def add_weekly_goals(goals):
+    """Bulk-inserts (week_date, goal_text, day_num) rows in one transaction.
 
+    Goals that already exist keep their completion state, so regenerating
+    the roadmap never duplicates rows. day_num is the roadmap day the goal
+    belongs to (None for custom goals); a roadmap day has one goal, which a
+    new start date moves to its new week.
+    """
+    with transaction() as conn:
+        conn.executemany(_UPSERT_WEEKLY_GOAL, goals)
+
+@_cached
 def get_weekly_goals(week_date):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('SELECT * FROM weekly_goals WHERE week_start_date = ?', (week_date,))
-    data = c.fetchall()
-    conn.close()
-    return data
+    """(id, week_start_date, goal_text, is_completed, created_at, day_num) rows."""
+    with connection() as conn:
+        return conn.execute('SELECT * FROM weekly_goals WHERE week_start_date = ?', (week_date,)).fetchall()
 
 def toggle_goal_complete(goal_id, current_status):
     new_status = not current_status
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('UPDATE weekly_goals SET is_completed = ? WHERE id = ?', (new_status, goal_id))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute('UPDATE weekly_goals SET is_completed = ? WHERE id = ?', (new_status, goal_id))
 
 def delete_goal(goal_id):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('DELETE FROM weekly_goals WHERE id = ?', (goal_id,))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute('DELETE FROM weekly_goals WHERE id = ?', (goal_id,))
+
+def delete_roadmap_goals(after_day=0):
+    """Deletes the goals generated from a roadmap plan for days after `after_day` (custom goals are kept)."""
+    with transaction() as conn:
+        conn.execute('DELETE FROM weekly_goals WHERE day_num > ?', (after_day,))
 
 # --- Projects ---
+PROJECT_GRACE_DAYS = 7  # an untracked roadmap project counts as "Missing" this many days after its day
+
 def add_project(name, description, status, link, roadmap_day=None):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('''
-        INSERT INTO projects (name, description, status, github_link, roadmap_project_day)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (name, description, status, link, roadmap_day))
-    conn.commit()
-    conn.close()
+    """Adds a project; a roadmap day that already has one is left as it is.
 
+    Returns the number of projects added (0 if the day was already tracked).
+    """
+    with transaction() as conn:
+        added = conn.execute('''
+            INSERT INTO projects (name, description, status, github_link, roadmap_project_day)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (roadmap_project_day) WHERE roadmap_project_day IS NOT NULL DO NOTHING
+        ''', (name, description, status, link, roadmap_day)).rowcount
+        if added:
+            _bump_projects_done(conn, None, status)
+        return added
+
+@_cached
+def get_roadmap_projects(projects, current_day):
+    """Tracking state of a plan's projects, given as (day, title) pairs.
+
+    Returns (day, project_id, status, github_link) rows in day order. A
+    project is matched on roadmap_project_day, or by name for rows from before
+    that column existed. Untracked projects get project_id None and a status
+    of 'Upcoming', 'Not Started' or 'Missing' (PROJECT_GRACE_DAYS after their
+    day), relative to the learner's `current_day` of the roadmap.
+    """
+    projects = list(projects)
+    if not projects:
+        return []
+    values = ", ".join(["(?, ?)"] * len(projects))
+    with connection() as conn:
+        rows = conn.execute(f'''
+            WITH plan (day, title) AS (VALUES {values})
+            SELECT plan.day, p.id,
+                   CASE WHEN p.id IS NOT NULL THEN p.status
+                        WHEN ? > plan.day + ? THEN 'Missing'
+                        WHEN ? >= plan.day THEN 'Not Started'
+                        ELSE 'Upcoming' END,
+                   p.github_link
+            FROM plan LEFT JOIN projects p ON p.id = COALESCE(
+                (SELECT id FROM projects WHERE roadmap_project_day = plan.day),
+                (SELECT MAX(id) FROM projects WHERE roadmap_project_day IS NULL AND name = plan.title))
+        ''', [v for pair in projects for v in pair] + [current_day, PROJECT_GRACE_DAYS, current_day]).fetchall()
+    return sorted(rows, key=lambda row: row[0])
+
+@_cached
 def get_projects():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('SELECT * FROM projects ORDER BY created_at DESC')
-    data = c.fetchall()
-    conn.close()
-    return data
+    with connection() as conn:
+        return conn.execute('SELECT * FROM projects ORDER BY created_at DESC').fetchall()
 
 def update_project_status(project_id, new_status):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('UPDATE projects SET status = ? WHERE id = ?', (new_status, project_id))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        old = conn.execute('SELECT status FROM projects WHERE id = ?', (project_id,)).fetchone()
+        conn.execute('UPDATE projects SET status = ? WHERE id = ?', (new_status, project_id))
+        if old:
+            _bump_projects_done(conn, old[0], new_status)
 
 def update_project_link(project_id, new_link):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('UPDATE projects SET github_link = ? WHERE id = ?', (new_link, project_id))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute('UPDATE projects SET github_link = ? WHERE id = ?', (new_link, project_id))
+
+def update_project(project_id, new_status, new_link):
+    """Updates a project's status and link together, in one transaction."""
+    with transaction():
+        update_project_status(project_id, new_status)
+        update_project_link(project_id, new_link)
 
 def delete_project(project_id):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('DELETE FROM projects WHERE id = ?', (project_id,))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        old = conn.execute('SELECT status FROM projects WHERE id = ?', (project_id,)).fetchone()
+        conn.execute('DELETE FROM projects WHERE id = ?', (project_id,))
+        if old:
+            _bump_projects_done(conn, old[0], None)
 
 # --- Settings ---
 def set_setting(key, value):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)', (key, value))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute('INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)', (key, value))
 
+@_cached
 def get_setting(key):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('SELECT value FROM settings WHERE key = ?', (key,))
-    result = c.fetchone()
-    conn.close()
+    with connection() as conn:
+        result = conn.execute('SELECT value FROM settings WHERE key = ?', (key,)).fetchone()
     return result[0] if result else None
 
 # --- Monthly Assessments ---
 def add_monthly_assessment(month_str, reflection, rating):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('SELECT id FROM monthly_assessments WHERE month_str = ?', (month_str,))
-    exist = c.fetchone()
-    if exist:
-        c.execute('UPDATE monthly_assessments SET reflection_text = ?, rating = ? WHERE id = ?', (reflection, rating, exist[0]))
-    else:
-        c.execute('INSERT INTO monthly_assessments (month_str, reflection_text, rating) VALUES (?, ?, ?)', (month_str, reflection, rating))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        c = conn.cursor()
+        c.execute('SELECT id FROM monthly_assessments WHERE month_str = ?', (month_str,))
+        exist = c.fetchone()
+        if exist:
+            c.execute('UPDATE monthly_assessments SET reflection_text = ?, rating = ? WHERE id = ?', (reflection, rating, exist[0]))
+        else:
+            c.execute('INSERT INTO monthly_assessments (month_str, reflection_text, rating) VALUES (?, ?, ?)', (month_str, reflection, rating))
 
+@_cached
 def get_monthly_assessments():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('SELECT * FROM monthly_assessments ORDER BY month_str DESC')
-    data = c.fetchall()
-    conn.close()
-    return data
+    with connection() as conn:
+        return conn.execute('SELECT * FROM monthly_assessments ORDER BY month_str DESC').fetchall()
 
 # --- Quiz Results ---
 def add_quiz_result(date, score, total, topic):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('''
-        INSERT OR REPLACE INTO quiz_results (date, score, total_questions, topic_covered)
-        VALUES (?, ?, ?, ?)
-    ''', (date, score, total, topic))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        c = conn.cursor()
+        c.execute('''
+            INSERT OR REPLACE INTO quiz_results (date, score, total_questions, topic_covered)
+            VALUES (?, ?, ?, ?)
+        ''', (date, score, total, topic))
+        _refresh_rollups(c, date, date)
 
+@_cached
 def get_quiz_result(date):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('SELECT * FROM quiz_results WHERE date = ?', (date,))
-    data = c.fetchone()
-    conn.close()
-    return data
+    with connection() as conn:
+        return conn.execute('SELECT * FROM quiz_results WHERE date = ?', (date,)).fetchone()
+
+_STATS_UPSERT = '''
+    INSERT INTO {table} ({key}, attempts, correct) VALUES (?, ?, ?)
+    ON CONFLICT ({key}) DO UPDATE SET
+        attempts = attempts + excluded.attempts,
+        correct = correct + excluded.correct
+'''
+
+def _bump_quiz_stats(c, answers, sign):
+    # answers are (question_id, topic, difficulty, is_correct); sign -1 takes them back out
+    for table, key, pick in (('question_stats', 'question_id', 0), ('topic_stats', 'topic', 1),
+                             ('difficulty_stats', 'difficulty', 2)):
+        attempts, correct = Counter(), Counter()
+        for answer in answers:
+            if answer[pick] is not None:
+                attempts[answer[pick]] += 1
+                correct[answer[pick]] += bool(answer[3])
+        c.executemany(_STATS_UPSERT.format(table=table, key=key),
+                      [(k, sign * n, sign * correct[k]) for k, n in attempts.items()])
+
+def _rebuild_quiz_stats(c):
+    for table in ('question_stats', 'topic_stats', 'difficulty_stats'):
+        c.execute(f'DELETE FROM {table}')
+    # Streamed along the date index and added in chunks, like the write path does
+    answers = c.connection.execute(
+        'SELECT question_id, topic, difficulty, is_correct FROM quiz_answers ORDER BY date')
+    while True:
+        chunk = answers.fetchmany(DEFAULT_CHUNK_SIZE)
+        if not chunk:
+            break
+        _bump_quiz_stats(c, chunk, 1)
+
+def add_quiz_answers(date, answers):
+    """Records a quiz's answers: (question_id, topic, difficulty, chosen, is_correct) rows.
+
+    Replaces any answers already recorded for `date`. The per-question,
+    per-topic and per-difficulty totals are updated in the same transaction.
+    """
+    answers = [(question_id, topic, difficulty, chosen, int(bool(is_correct)))
+               for question_id, topic, difficulty, chosen, is_correct in answers]
+    with transaction() as conn:
+        c = conn.cursor()
+        previous = c.execute(
+            'SELECT question_id, topic, difficulty, is_correct FROM quiz_answers WHERE date = ?', (date,)).fetchall()
+        if previous:
+            _bump_quiz_stats(c, previous, -1)
+            c.execute('DELETE FROM quiz_answers WHERE date = ?', (date,))
+        c.executemany('''
+            INSERT INTO quiz_answers (date, question_id, topic, difficulty, chosen, is_correct)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [(date,) + answer for answer in answers])
+        _bump_quiz_stats(c, [(q, t, d, ok) for q, t, d, _, ok in answers], 1)
+
+@_cached
+def get_quiz_answers(date):
+    with connection() as conn:
+        return conn.execute('''
+            SELECT question_id, topic, difficulty, chosen, is_correct
+            FROM quiz_answers WHERE date = ? ORDER BY id
+        ''', (date,)).fetchall()
+
+@_cached
+def get_difficulty_stats():
+    """{difficulty: (attempts, correct)} for every difficulty answered so far."""
+    placeholders = ", ".join("?" * len(DIFFICULTIES))
+    with connection() as conn:
+        rows = conn.execute(
+            f'SELECT difficulty, attempts, correct FROM difficulty_stats WHERE difficulty IN ({placeholders})',
+            DIFFICULTIES)
+        return {difficulty: (attempts, correct) for difficulty, attempts, correct in rows}
+
+@_cached
+def get_question_stats(question_ids):
+    """{question_id: (attempts, correct)} for the given questions."""
+    question_ids = list(question_ids)
+    if not question_ids:
+        return {}
+    with connection() as conn:
+        rows = conn.execute(
+            f'SELECT question_id, attempts, correct FROM question_stats WHERE question_id IN ({", ".join("?" * len(question_ids))})',
+            question_ids)
+        return {qid: (attempts, correct) for qid, attempts, correct in rows}
+
+@_cached
+def get_hardest_questions(limit=10, min_attempts=1):
+    """(question_id, question, topic, difficulty, attempts, correct), lowest accuracy first."""
+    with connection() as conn:
+        return conn.execute('''
+            SELECT s.question_id, b.question, b.topic, b.difficulty, s.attempts, s.correct
+            -- CROSS JOIN keeps question_stats outermost, read in accuracy order
+            FROM question_stats s CROSS JOIN question_bank b ON b.id = s.question_id
+            WHERE s.attempts >= ?
+            ORDER BY s.correct * 1.0 / s.attempts LIMIT ?
+        ''', (min_attempts, limit)).fetchall()
+
+@_cached
+def get_weakest_topics(limit=10, min_attempts=1):
+    """(topic, attempts, correct), lowest accuracy first."""
+    with connection() as conn:
+        return conn.execute('''
+            SELECT topic, attempts, correct FROM topic_stats
+            WHERE attempts >= ?
+            ORDER BY correct * 1.0 / attempts LIMIT ?
+        ''', (min_attempts, limit)).fetchall()
+
+# --- Revision Queue ---
+REVISION_COLUMNS = ('topic, ease, interval_days, repetitions, due_date, last_review, last_quality, '
+                    'prev_ease, prev_interval_days, prev_repetitions, prev_due_date')
+
+@_cached
+def get_revision_items(topics):
+    """{topic: revision_queue row} for the given topics that are in the queue."""
+    topics = list(dict.fromkeys(topics))
+    if not topics:
+        return {}
+    with connection() as conn:
+        rows = conn.execute(
+            f'SELECT {REVISION_COLUMNS} FROM revision_queue WHERE topic IN ({", ".join("?" * len(topics))})',
+            topics)
+        return {row[0]: row for row in rows}
+
+def get_topic_confidence(topic):
+    """(date, confidence_score) of every log covering `topic` with a score, oldest first."""
+    with connection() as conn:
+        return conn.execute('''
+            SELECT t.date, d.confidence_score
+            FROM log_topics t JOIN daily_logs d ON d.date = t.date
+            WHERE t.topic = ? AND d.confidence_score IS NOT NULL
+            ORDER BY t.date
+        ''', (topic,)).fetchall()
+
+def get_quiz_scores(titles):
+    """(date, score, total_questions) of every quiz whose topic is one of `titles`, in no particular order."""
+    titles = list(dict.fromkeys(titles))
+    if not titles:
+        return []
+    with connection() as conn:
+        return conn.execute(
+            f'SELECT date, score, total_questions FROM quiz_results WHERE topic_covered IN ({", ".join("?" * len(titles))})',
+            titles).fetchall()
+
+def save_revision_items(rows):
+    """Inserts or replaces revision_queue rows (in REVISION_COLUMNS order)."""
+    with transaction() as conn:
+        conn.executemany(f'INSERT OR REPLACE INTO revision_queue ({REVISION_COLUMNS}) VALUES ({", ".join("?" * 11)})',
+                         rows)
+
+def clear_revision_queue():
+    with transaction() as conn:
+        conn.execute('DELETE FROM revision_queue')
+
+@_cached
+def get_due_revisions(date, limit=20):
+    """(topic, due_date, interval_days, repetitions) due on or before `date`, most overdue first."""
+    with connection() as conn:
+        return conn.execute('''
+            SELECT topic, due_date, interval_days, repetitions FROM revision_queue
+            WHERE due_date <= ? ORDER BY due_date LIMIT ?
+        ''', (date, limit)).fetchall()
+
+@_cached
+def count_due_revisions(date):
+    with connection() as conn:
+        return conn.execute('SELECT COUNT(*) FROM revision_queue WHERE due_date <= ?', (date,)).fetchone()[0]
+
+# --- Question Bank ---
+DIFFICULTIES = ('Easy', 'Medium', 'Hard')
+QUESTION_COLUMNS = 'id, topic, difficulty, question, options, answer, tags, source'
+
+def _question_row(row):
+    # options are stored as JSON; hand them back as a tuple
+    return row[:4] + (tuple(json.loads(row[4])),) + row[5:]
+
+def add_questions(questions, source='generated'):
+    """Bulk-adds (topic, difficulty, question, options, answer, tags) rows.
+
+    A question already in the bank for the same topic is left as it is.
+    Returns the number of questions actually added.
+    """
+    rows = [(topic, difficulty, question, json.dumps(list(options)), answer, tags or '', source)
+            for topic, difficulty, question, options, answer, tags in questions]
+    with transaction() as conn:
+        return conn.executemany('''
+            INSERT INTO question_bank (topic, difficulty, question, options, answer, tags, source)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (topic, question) DO NOTHING
+        ''', rows).rowcount
+
+def get_quiz_questions(topic, per_difficulty=5, seed=None):
+    """Draws up to per_difficulty questions of each difficulty for a topic.
+
+    Returns (id, topic, difficulty, question, options, answer, tags, source)
+    rows, Easy first, then Medium, then Hard. The draw is random, or
+    repeatable when a seed is given.
+    """
+    with connection() as conn:
+        # Ids only, straight from the (topic, difficulty) index
+        by_difficulty = {}
+        for qid, difficulty in conn.execute(
+                'SELECT id, difficulty FROM question_bank WHERE topic = ? ORDER BY difficulty, id', (topic,)):
+            by_difficulty.setdefault(difficulty, []).append(qid)
+        rng = random.Random(f"{seed}:{topic}") if seed is not None else random.Random()
+        chosen = []
+        for difficulty in DIFFICULTIES:
+            ids = by_difficulty.get(difficulty, [])
+            chosen += rng.sample(ids, min(per_difficulty, len(ids)))
+        if not chosen:
+            return []
+        rows = {row[0]: row for row in conn.execute(
+            f'SELECT {QUESTION_COLUMNS} FROM question_bank WHERE id IN ({", ".join("?" * len(chosen))})', chosen)}
+    return [_question_row(rows[qid]) for qid in chosen]
+
+def _fts_query(text):
+    # Each word becomes a quoted prefix term, so user input can't be FTS5 syntax
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+@_cached
+def search_questions(text, limit=50, topic=None):
+    """Questions matching every word of `text` (as a prefix), best match first."""
+    query = _fts_query(text)
+    if not query:
+        return []
+    sql = f'''
+        SELECT {", ".join("q." + col for col in QUESTION_COLUMNS.split(", "))}
+        FROM question_bank_fts f JOIN question_bank q ON q.id = f.rowid
+        WHERE question_bank_fts MATCH ?
+    '''
+    params = [query]
+    if topic is not None:
+        sql += ' AND q.topic = ?'
+        params.append(topic)
+    sql += ' ORDER BY f.rank LIMIT ?'
+    params.append(limit)
+    with connection() as conn:
+        return [_question_row(row) for row in conn.execute(sql, params)]
+
+@_cached
+def count_questions():
+    with connection() as conn:
+        return conn.execute('SELECT COUNT(*) FROM question_bank').fetchone()[0]
+
+@_cached
+def get_banked_topics(topics):
+    """The subset of `topics` that already has questions in the bank."""
+    topics = list(topics)
+    if not topics:
+        return set()
+    with connection() as conn:
+        return {topic for (topic,) in conn.execute(
+            f'SELECT DISTINCT topic FROM question_bank WHERE topic IN ({", ".join("?" * len(topics))})', topics)}
+
+# --- Activity Rollups ---
+# daily_rollup has a row for every day with a log or a quiz, weekly_rollup
+# one for every Monday-based week with any. Both are recomputed for the
+# affected day and week in the same transaction as the write.
+DAILY_ROLLUP_COLUMNS = 'date, logged, topics, confidence, quizzed, quiz_score, quiz_total'
+WEEKLY_ROLLUP_COLUMNS = ('week_start, days_logged, topics, confidence_sum, confidence_count, '
+                         'quizzes, quiz_score, quiz_total')
+
+_DAILY_ROLLUP_SOURCES = (
+    '''
+        INSERT INTO daily_rollup (date, logged, confidence)
+        SELECT date, 1, confidence_score FROM daily_logs WHERE date BETWEEN :start AND :end
+    ''',
+    '''
+        INSERT INTO daily_rollup (date, topics)
+        SELECT date, COUNT(*) FROM log_topics WHERE date BETWEEN :start AND :end GROUP BY date
+        ON CONFLICT (date) DO UPDATE SET topics = excluded.topics
+    ''',
+    '''
+        INSERT INTO daily_rollup (date, quizzed, quiz_score, quiz_total)
+        SELECT date, 1, score, total_questions FROM quiz_results WHERE date BETWEEN :start AND :end
+        ON CONFLICT (date) DO UPDATE SET
+            quizzed = 1, quiz_score = excluded.quiz_score, quiz_total = excluded.quiz_total
+    ''',
+)
+
+def _week_start(date_str):
+    d = _parse_date(date_str)
+    return (d - datetime.timedelta(days=d.weekday())).isoformat()
+
+def _refresh_rollups(c, start, end):
+    """Recomputes daily_rollup for start <= date <= end, then weekly_rollup for the weeks those days fall in."""
+    span = {'start': start, 'end': end}
+    c.execute('DELETE FROM daily_rollup WHERE date BETWEEN :start AND :end', span)
+    for sql in _DAILY_ROLLUP_SOURCES:
+        c.execute(sql, span)
+
+    first = _week_start(start)
+    last = (_parse_date(_week_start(end)) + datetime.timedelta(days=6)).isoformat()
+    weeks = {}
+    for date, logged, topics, confidence, quizzed, quiz_score, quiz_total in c.execute(
+            f'SELECT {DAILY_ROLLUP_COLUMNS} FROM daily_rollup WHERE date BETWEEN ? AND ?', (first, last)):
+        week = weeks.setdefault(_week_start(date), [0] * 7)
+        for i, value in enumerate((logged, topics, confidence or 0, confidence is not None,
+                                   quizzed, quiz_score or 0, quiz_total or 0)):
+            week[i] += value
+    c.execute('DELETE FROM weekly_rollup WHERE week_start BETWEEN ? AND ?', (first, last))
+    c.executemany(f'INSERT INTO weekly_rollup ({WEEKLY_ROLLUP_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                  [(week, *totals) for week, totals in weeks.items()])
+
+def _rebuild_rollups(c):
+    c.execute('DELETE FROM daily_rollup')
+    c.execute('DELETE FROM weekly_rollup')
+    start, end = c.execute('''
+        SELECT MIN(first), MAX(last) FROM (
+            SELECT MIN(date) AS first, MAX(date) AS last FROM daily_logs
+            UNION ALL SELECT MIN(date), MAX(date) FROM quiz_results
+        )
+    ''').fetchone()
+    if start is not None:
+        _refresh_rollups(c, start, end)
+
+@_cached
+def get_daily_rollup(start_date, end_date):
+    """DAILY_ROLLUP_COLUMNS for the days from start_date to end_date (inclusive) with a log or quiz, oldest first."""
+    with connection() as conn:
+        return conn.execute(
+            f'SELECT {DAILY_ROLLUP_COLUMNS} FROM daily_rollup WHERE date BETWEEN ? AND ? ORDER BY date',
+            (start_date, end_date)).fetchall()
+
+@_cached
+def get_weekly_rollup(start_date='0001-01-01', end_date='9999-12-31'):
+    """WEEKLY_ROLLUP_COLUMNS for the weeks starting from start_date to end_date (inclusive), oldest first."""
+    with connection() as conn:
+        return conn.execute(
+            f'SELECT {WEEKLY_ROLLUP_COLUMNS} FROM weekly_rollup WHERE week_start BETWEEN ? AND ? ORDER BY week_start',
+            (start_date, end_date)).fetchall()
+
+# --- Streaming Reads ---
+# Generator versions of the get_all_* listings for exports and long
+# histories: rows are fetched chunk_size at a time and only the requested
+# columns are read, so memory stays bounded however many rows there are.
+
+LOG_COLUMNS = ('date', 'planned_tasks', 'actual_learning', 'confidence_score',
+               'created_at', 'topics_covered', 'revision_notes')
+PROJECT_COLUMNS = ('id', 'name', 'description', 'status', 'github_link',
+                   'created_at', 'roadmap_project_day')
+ASSESSMENT_COLUMNS = ('id', 'month_str', 'reflection_text', 'rating', 'created_at')
+QUIZ_RESULT_COLUMNS = ('date', 'score', 'total_questions', 'topic_covered', 'created_at')
+DEFAULT_CHUNK_SIZE = 500
+
+def _iter_rows(table, allowed, columns, order_by, chunk_size):
+    columns = tuple(columns or allowed)
+    unknown = set(columns) - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown {table} columns: {sorted(unknown)}")
+    # A dedicated pooled connection rather than the thread's shared one, so
+    # a half-consumed generator never holds on to a connection that other
+    # calls on this thread have already handed back. Like connection(), it
+    # first waits for this database's deferred writes.
+    path = current_database()
+    _await_writes(path)
+    conn = _acquire(path)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f'SELECT {", ".join(columns)} FROM {table} ORDER BY {order_by}')
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        # Finish the statement first: a generator dropped half-way would
+        # otherwise hand the next borrower a connection mid-read
+        cursor.close()
+        _release(path, conn)
+
+def iter_logs(columns=None, chunk_size=DEFAULT_CHUNK_SIZE, newest_first=True):
+    """Yields daily_logs rows (all LOG_COLUMNS unless `columns` is given)."""
+    order = 'date DESC' if newest_first else 'date'
+    return _iter_rows('daily_logs', LOG_COLUMNS, columns, order, chunk_size)
+
+def iter_projects(columns=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    return _iter_rows('projects', PROJECT_COLUMNS, columns, 'created_at DESC', chunk_size)
+
+def iter_monthly_assessments(columns=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    return _iter_rows('monthly_assessments', ASSESSMENT_COLUMNS, columns, 'month_str DESC', chunk_size)
+
+def iter_quiz_results(columns=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields quiz_results rows, oldest first."""
+    return _iter_rows('quiz_results', QUIZ_RESULT_COLUMNS, columns, 'date', chunk_size)
 
 # --- Analytics Queries ---
+# Dashboard numbers come from the single learner_stats row, updated in the
+# same transaction as the write that changes them.
+
+# Narrow, date-ordered columns for analytics.py to turn into arrays. Not
+# @_cached: analytics.py keeps the arrays it builds from them instead, which
+# are far smaller than a long history's row tuples.
+def get_confidence_history():
+    """(date, confidence_score) for every log with a score, oldest first."""
+    with connection() as conn:
+        return conn.execute(
+            'SELECT date, confidence_score FROM daily_logs WHERE confidence_score IS NOT NULL ORDER BY date').fetchall()
+
+def get_quiz_history():
+    """(date, score, total_questions) for every quiz taken, oldest first."""
+    with connection() as conn:
+        return conn.execute('SELECT date, score, total_questions FROM quiz_results ORDER BY date').fetchall()
+
+def _parse_date(date_str):
+    return datetime.date.fromisoformat(date_str)  # 'YYYY-MM-DD', much cheaper than strptime
+
+def _compute_streaks(c):
+    """Walks every log date once: (last date, streak ending there, longest streak)."""
+    last, streak, longest = None, 0, 0
+    for (date_str,) in c.execute('SELECT date FROM daily_logs ORDER BY date'):
+        d = _parse_date(date_str)
+        streak = streak + 1 if last and (d - last).days == 1 else 1
+        longest = max(longest, streak)
+        last = d
+    return (last.strftime("%Y-%m-%d") if last else None), streak, longest
+
+_RUN_NEIGHBOURS = {
+    -1: 'SELECT date FROM daily_logs WHERE date < ? ORDER BY date DESC',
+    1: 'SELECT date FROM daily_logs WHERE date > ? ORDER BY date',
+}
+
+def _run_length(c, date, step):
+    """Consecutive logged days right before (step -1) or after (step 1) `date`, not counting it.
+
+    Reads the neighbouring dates off the date index and stops at the first
+    gap, so it costs the length of that run, not the history.
+    """
+    expected = _parse_date(date)
+    n = 0
+    for (date_str,) in c.execute(_RUN_NEIGHBOURS[step], (date,)):
+        expected += datetime.timedelta(days=step)
+        if date_str != expected.isoformat():
+            break
+        n += 1
+    return n
+
+def _bump_log_stats(c, date, previous, confidence):
+    # previous is the (confidence_score,) row being replaced, or None
+    if previous is not None:
+        old_conf = previous[0]
+        c.execute('''
+            UPDATE learner_stats SET
+                confidence_sum = confidence_sum - ? + ?,
+                confidence_count = confidence_count - ? + ?
+            WHERE id = 1
+        ''', (old_conf or 0, confidence or 0, old_conf is not None, confidence is not None))
+        return
+
+    last_log_date, streak, longest = c.execute(
+        'SELECT last_log_date, streak, longest_streak FROM learner_stats WHERE id = 1').fetchone()
+    gap = (_parse_date(date) - _parse_date(last_log_date)).days if last_log_date else None
+    if gap is None or gap > 1:
+        last_log_date, streak = date, 1
+    elif gap == 1:
+        last_log_date, streak = date, streak + 1
+    else:
+        # Back-filled an older day: it may join the runs either side of it
+        before, after = _run_length(c, date, -1), _run_length(c, date, 1)
+        longest = max(longest, before + 1 + after)
+        if (_parse_date(last_log_date) - _parse_date(date)).days == after:
+            streak = before + 1 + after  # the joined run ends at last_log_date
+    c.execute('''
+        UPDATE learner_stats SET
+            total_logs = total_logs + 1,
+            confidence_sum = confidence_sum + ?,
+            confidence_count = confidence_count + ?,
+            last_log_date = ?, streak = ?, longest_streak = MAX(longest_streak, ?, ?)
+        WHERE id = 1
+    ''', (confidence or 0, confidence is not None, last_log_date, streak, streak, longest))
+
+def _bump_projects_done(c, old_status, new_status):
+    delta = (new_status == 'Done') - (old_status == 'Done')
+    if delta:
+        c.execute('UPDATE learner_stats SET projects_done = projects_done + ? WHERE id = 1', (delta,))
+
+def _rebuild_stats(c):
+    total_logs, confidence_sum, confidence_count = c.execute(
+        'SELECT COUNT(*), COALESCE(SUM(confidence_score), 0), COUNT(confidence_score) FROM daily_logs').fetchone()
+    projects_done = c.execute("SELECT COUNT(*) FROM projects WHERE status = 'Done'").fetchone()[0]
+    last_log_date, streak, longest = _compute_streaks(c)
+    c.execute('''
+        INSERT OR REPLACE INTO learner_stats
+            (id, total_logs, confidence_sum, confidence_count, projects_done, last_log_date, streak, longest_streak)
+        VALUES (1, ?, ?, ?, ?, ?, ?, ?)
+    ''', (total_logs, confidence_sum, confidence_count, projects_done, last_log_date, streak, longest))
+
+def rebuild_stats():
+    """Recomputes learner_stats, the quiz answer totals and the activity rollups from scratch (e.g. after importing rows directly)."""
+    with transaction() as conn:
+        c = conn.cursor()
+        _rebuild_stats(c)
+        _rebuild_quiz_stats(c)
+        _rebuild_rollups(c)
+
+@_cached
+def _stats_row():
+    with connection() as conn:
+        return conn.execute('''
+            SELECT total_logs, confidence_sum, confidence_count, projects_done,
+                   last_log_date, streak, longest_streak
+            FROM learner_stats WHERE id = 1
+        ''').fetchone()
+
 def get_analytics_stats():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    
-    # Total Logs
-    c.execute('SELECT COUNT(*) FROM daily_logs')
-    total_logs = c.fetchone()[0]
-    
-    # Average Confidence
-    c.execute('SELECT AVG(confidence_score) FROM daily_logs')
-    avg_confidence = c.fetchone()[0] or 0.0
+    # Only the row is cached; whether the streak is current depends on today
+    total_logs, confidence_sum, confidence_count, projects_done, last_log_date, streak, longest = _stats_row()
     
-    # Projects Completed
-    c.execute("SELECT COUNT(*) FROM projects WHERE status = 'Done'")
-    projects_done = c.fetchone()[0]
-    
-    # Calculate Streak
-    c.execute('SELECT DISTINCT date FROM daily_logs ORDER BY date DESC')
-    dates = [row[0] for row in c.fetchall()]
-    
-    streak = 0
-    today = datetime.date.today()
-    
-    # Simple streak logic
+    # The stored streak ends at the last log; it's current if that was today or yesterday
     current_streak = 0
-    if dates:
-        last_log = datetime.datetime.strptime(dates[0], "%Y-%m-%d").date()
-        diff = (today - last_log).days
-        if diff <= 1:
-            current_streak = 1
-            previous_date = last_log
-            for i in range(1, len(dates)):
-                d = datetime.datetime.strptime(dates[i], "%Y-%m-%d").date()
-                if (previous_date - d).days == 1:
-                    current_streak += 1
-                    previous_date = d
-                else:
-                    break
-        else:
-            current_streak = 0
-            
-    conn.close()
+    if last_log_date and (datetime.date.today() - _parse_date(last_log_date)).days <= 1:
+        current_streak = streak
     
     return {
         "total_logs": total_logs,
-        "avg_confidence": round(avg_confidence, 1),
+        "avg_confidence": round(confidence_sum / confidence_count, 1) if confidence_count else 0.0,
         "projects_done": projects_done,
-        "current_streak": current_streak
+        "current_streak": current_streak,
+        "longest_streak": longest
     }
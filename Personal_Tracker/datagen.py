@@ -0,0 +1,175 @@
+"""Synthetic load-test data for the tracker.
+
+Builds one SQLite file per learner (the same schema init_db() creates) with
+years of daily logs whose topics come from the default roadmap plan, quiz
+results with their answers (drawn from a question bank of the plan's week
+quizzes), weekly goals, projects keyed to the plan's projects, monthly
+assessments and settings. The derived tables (stats, rollups and the
+revision queue) are then rebuilt by the app's own code. Output is
+deterministic for a given --seed.
+
+    python datagen.py --learners 1000 --years 2 --out-dir loadtest --jobs 8
+
+Rows go in with executemany inside a single transaction per file, with
+journaling and fsync switched off while building (a half-built file is
+simply regenerated), so millions of rows take seconds.
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+from multiprocessing import Pool
+
+import database as db
+import quiz_engine
+import roadmap_index
+import spaced_repetition
+
+PLAN = roadmap_index.get()
+ROADMAP_DAYS = PLAN.days[1:]
+PLAN_LENGTH = len(ROADMAP_DAYS)
+PROJECT_DAYS = sorted(PLAN.projects)
+WEEK_TITLES = [PLAN.week_title(w) for w in range(1, PLAN.total_weeks + 1)]
+QUIZZES = quiz_engine.generate_quizzes(WEEK_TITLES)
+STATUSES = ("Not Started", "In Progress", "Done")
+REVISION_NOTES = ("", "", "Re-read the notes", "Redo the practice problems", "Review the derivation",
+                  "Revisit the NumPy exercises", "Watch the lecture again")
+
+
+def learner_rows(rng, start, days, log_rate):
+    """Generates every table's rows for one learner, from `start` for `days` days."""
+    logs, topics, quizzes, answers, goals, projects, assessments = [], [], [], [], [], [], []
+    skill = rng.uniform(0.4, 0.9)  # how well this learner tends to do
+
+    for offset in range(days):
+        date = start + datetime.timedelta(days=offset)
+        date_str = date.strftime("%Y-%m-%d")
+        plan_day = offset % PLAN_LENGTH
+        day = ROADMAP_DAYS[plan_day]
+
+        # Each pass through the plan gets its own set of weekly goals. day_num is
+        # unique, so only the first pass is keyed to the roadmap; later passes
+        # are stored like goals the learner typed in themselves
+        if plan_day == 0:
+            first_pass = offset == 0
+            for d in ROADMAP_DAYS:
+                week_start = date + datetime.timedelta(weeks=d.week - 1)
+                goals.append((week_start.strftime("%Y-%m-%d"), f"Day {d.number}: {d.title}",
+                              d.number if first_pass else None, rng.random() < skill, f"{date_str} 09:00:00"))
+
+        # created_at is set explicitly so the output doesn't depend on the clock
+        created_at = f"{date_str} 20:00:00"
+        if rng.random() < log_rate:
+            covered = [t for t in day.topics if rng.random() < skill + 0.1] or list(day.topics[:1])
+            confidence = max(1, min(5, round(rng.gauss(1 + 4 * skill, 1))))
+            logs.append((date_str, json.dumps(covered), rng.choice(REVISION_NOTES), confidence, created_at))
+            topics.extend((date_str, i, t) for i, t in enumerate(covered))
+
+        if rng.random() < log_rate * 0.8:
+            title = PLAN.week_title(day.week)
+            score = 0
+            for q in QUIZZES[title]:
+                correct = rng.random() < skill
+                chosen = q.answer if correct else rng.choice([o for o in q.options if o != q.answer])
+                answers.append((date_str, title, q.question, q.difficulty, chosen, int(correct), created_at))
+                score += correct
+            quizzes.append((date_str, score, len(QUIZZES[title]), title, created_at))
+
+        if date.day == 1:
+            prev_month = (date - datetime.timedelta(days=1)).strftime("%Y-%m")
+            assessments.append((prev_month, "Synthetic reflection", rng.randint(3, 10), created_at))
+
+    for r_day in PROJECT_DAYS:
+        if r_day <= days and rng.random() < skill + 0.1:
+            p = PLAN.projects[r_day]
+            status = rng.choice(STATUSES) if rng.random() > skill else "Done"
+            created_at = f"{start + datetime.timedelta(days=r_day - 1)} 20:00:00"
+            projects.append((p['title'], p['description'], status,
+                             f"https://github.com/learner/project-{r_day}", r_day, created_at))
+
+    return logs, topics, quizzes, answers, goals, projects, assessments
+
+
+def build_template(path):
+    """A fully migrated database holding only the question bank, that every learner file starts as a copy of."""
+    db.DB_NAME = path
+    db.init_db()
+    db.add_questions(row for w, title in enumerate(WEEK_TITLES, 1)
+                     for row in quiz_engine.to_bank_rows(title, QUIZZES[title], f"week{w}"))
+    db.close_all()
+
+
+def build_learner(args):
+    path, template, learner_seed, years, log_rate = args
+    rng = random.Random(learner_seed)
+    start = datetime.date(2020, 1, 6) + datetime.timedelta(days=rng.randint(0, 365))
+    logs, topics, quizzes, answers, goals, projects, assessments = learner_rows(rng, start, int(years * 365), log_rate)
+
+    # Schema from the app's own migrations, then bulk load on a raw connection
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    shutil.copyfile(template, path)
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("BEGIN")
+    question_ids = {(topic, question): qid for qid, topic, question in conn.execute("SELECT id, topic, question FROM question_bank")}
+    conn.executemany("INSERT INTO daily_logs (date, topics_covered, revision_notes, confidence_score, created_at) VALUES (?, ?, ?, ?, ?)", logs)
+    conn.executemany("INSERT INTO log_topics (date, position, topic) VALUES (?, ?, ?)", topics)
+    conn.executemany("INSERT INTO quiz_results (date, score, total_questions, topic_covered, created_at) VALUES (?, ?, ?, ?, ?)", quizzes)
+    conn.executemany("INSERT INTO quiz_answers (date, question_id, topic, difficulty, chosen, is_correct, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                     [(date, question_ids[topic, question], topic, difficulty, chosen, correct, created_at)
+                      for date, topic, question, difficulty, chosen, correct, created_at in answers])
+    conn.executemany("INSERT INTO weekly_goals (week_start_date, goal_text, day_num, is_completed, created_at) VALUES (?, ?, ?, ?, ?)", goals)
+    conn.executemany("INSERT INTO projects (name, description, status, github_link, roadmap_project_day, created_at) VALUES (?, ?, ?, ?, ?, ?)", projects)
+    conn.executemany("INSERT INTO monthly_assessments (month_str, reflection_text, rating, created_at) VALUES (?, ?, ?, ?)", assessments)
+    conn.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                     [("roadmap_start_date", start.strftime("%Y-%m-%d")), ("roadmap_plan", PLAN.id)])
+    conn.execute("COMMIT")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.close()
+
+    db.DB_NAME = path
+    db.init_db()  # already at the latest version; just marks it migrated
+    db.rebuild_stats()
+    spaced_repetition.rebuild(PLAN)
+    db.close_all()
+    return len(logs) + len(topics) + len(quizzes) + len(answers) + len(goals) + len(projects) + len(assessments) + 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--learners", type=int, default=1)
+    parser.add_argument("--years", type=float, default=1.0, help="history length per learner")
+    parser.add_argument("--log-rate", type=float, default=0.85, help="chance a learner logs on a given day")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out-dir", default="loadtest")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        template = os.path.join(tmp, "template.db")
+        build_template(template)
+        tasks = [
+            (os.path.join(args.out_dir, f"learner{i:05d}.db"), template, args.seed * 1_000_003 + i, args.years, args.log_rate)
+            for i in range(args.learners)
+        ]
+        if args.jobs > 1 and len(tasks) > 1:
+            with Pool(args.jobs) as pool:
+                rows = sum(pool.imap_unordered(build_learner, tasks, chunksize=4))
+        else:
+            rows = sum(map(build_learner, tasks))
+    elapsed = time.perf_counter() - start
+    print(f"{args.learners} learners, {rows:,} rows in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s) -> {args.out_dir}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Opt-in timing for queries, pages and quiz generation.
+
+Off by default. Turn it on from the Diagnostics page, with
+database.set_tracing(True), or by starting the app with TRACKER_TRACE=1
+(and TRACKER_TRACE_FILE=path.jsonl to also append every record to a file;
+the file can only be chosen there, not from the page).
+
+While off, database.py hands out plain sqlite3 connections and span() does
+nothing but check a flag, so there is no per-query cost.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+MAX_RECORDS = 5000  # most recent records kept in memory
+
+ENABLED = os.environ.get("TRACKER_TRACE") == "1"
+TRACE_FILE = os.environ.get("TRACKER_TRACE_FILE") or None
+JSONL_PATH = TRACE_FILE
+
+_lock = threading.Lock()
+_records = deque(maxlen=MAX_RECORDS)
+_unwritten = []
+
+
+def enable(jsonl_path=None):
+    global ENABLED, JSONL_PATH
+    ENABLED = True
+    JSONL_PATH = jsonl_path or None
+
+
+def disable():
+    global ENABLED
+    flush()
+    ENABLED = False
+
+
+def record(kind, name, seconds, rows=None):
+    """Stores one measurement and returns it (callers may update rows/ms later)."""
+    rec = {
+        "ts": time.time(),
+        "kind": kind,
+        "name": name,
+        "ms": seconds * 1000,
+        "rows": rows,
+        "thread": threading.current_thread().name,
+    }
+    with _lock:
+        _records.append(rec)
+        if JSONL_PATH:
+            _unwritten.append(rec)
+    return rec
+
+
+@contextmanager
+def span(kind, name):
+    """Times the block as one record, e.g. span("page", "Dashboard")."""
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(kind, name, time.perf_counter() - start)
+
+
+def flush():
+    """Appends records not yet written to the JSONL file, if one is configured."""
+    with _lock:
+        pending = _unwritten[:]
+        _unwritten.clear()
+        path = JSONL_PATH
+    if not path or not pending:
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        for rec in pending:
+            f.write(json.dumps(rec) + "\n")
+
+
+def clear():
+    with _lock:
+        _records.clear()
+        _unwritten.clear()
+
+
+def records(kind=None):
+    with _lock:
+        snapshot = list(_records)
+    return [r for r in snapshot if kind is None or r["kind"] == kind]
+
+
+def summary(kind):
+    """Per-name aggregates for one kind, slowest total time first."""
+    stats = {}
+    for r in records(kind):
+        s = stats.setdefault(r["name"], {"name": r["name"], "count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0})
+        s["count"] += 1
+        s["total_ms"] += r["ms"]
+        s["max_ms"] = max(s["max_ms"], r["ms"])
+        s["rows"] += r["rows"] or 0
+    for s in stats.values():
+        s["mean_ms"] = s["total_ms"] / s["count"]
+    return sorted(stats.values(), key=lambda s: s["total_ms"], reverse=True)
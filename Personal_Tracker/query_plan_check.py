@@ -0,0 +1,219 @@
+"""Query-plan guard for database.py.
+
+Seeds a scratch database, calls every public function in database.py while
+recording the SQL it runs, and prints EXPLAIN QUERY PLAN for each statement.
+Exits non-zero if any statement scans a whole table without an index or
+sorts through a temporary b-tree.
+
+    python query_plan_check.py --rows 100000
+
+New public functions must be added to CALLS (or SKIP), otherwise the check
+fails, so every query that ships has been looked at.
+"""
+import argparse
+import datetime
+import inspect
+import os
+import re
+import sys
+import tempfile
+
+import database as db
+
+# function name -> example arguments
+CALLS = {
+    # Before the seeded logs, so the back-fill streak lookups are checked too
+    "add_daily_log": ("1899-12-30", ["Python"], "notes", 4),
+    "get_daily_log": ("2030-01-01",),
+    "get_all_logs": (),
+    "get_recent_logs": (7,),
+    "get_logs_between": ("1900-03-01", "1900-03-05"),
+    "get_logs_for_dates": (["1900-03-01", "1900-03-03"],),
+    "get_log_topics": ("1900-03-01",),
+    "get_topics_for_dates": (["1900-03-01", "1900-03-03"],),
+    "get_topics_between": ("1900-03-01", "1900-03-05"),
+    "get_topic_coverage": (["Python", "NumPy"],),
+    "add_weekly_goal": ("2030-01-06", "Day 1: Check", 1),
+    "add_weekly_goals": ([("2030-01-06", "Day 2: Check", 2)],),
+    "get_weekly_goals": ("2030-01-06",),
+    "toggle_goal_complete": (1, False),
+    "delete_goal": (1,),
+    "delete_roadmap_goals": (),
+    "add_project": ("Check", "desc", "In Progress", "", 7),
+    "get_projects": (),
+    "update_project_status": (1, "Done"),
+    "update_project_link": (1, "https://example.com"),
+    "update_project": (1, "Done", "https://example.com"),
+    "get_confidence_history": (),
+    "get_quiz_history": (),
+    "get_daily_rollup": ("1900-01-01", "1900-12-31"),
+    "get_weekly_rollup": ("1900-01-01", "1900-12-31"),
+    "get_roadmap_projects": ([(7, "project 7"), (14, "project 14"), (21, "no such project")], 15),
+    "delete_project": (1,),
+    "set_setting": ("check", "1"),
+    "get_setting": ("check",),
+    "add_monthly_assessment": ("2030-01", "text", 7),
+    "get_monthly_assessments": (),
+    "add_quiz_result": ("2030-01-01", 10, 15, "Python"),
+    "get_quiz_result": ("2030-01-01",),
+    "add_questions": ([("Python", "Easy", "What is Python?", ["A language", "A snake"], "A language", "check")],),
+    "get_quiz_questions": ("Python", 5, 1),
+    "search_questions": ("python defin", 20),
+    "count_questions": (),
+    "get_banked_topics": (["Python Basics", "Linear Algebra"],),
+    "add_quiz_answers": ("2030-01-01", [(1, "Python", "Easy", "A language", True), (None, "Python", "Hard", "x", False)]),
+    "get_quiz_answers": ("2030-01-01",),
+    "get_difficulty_stats": (),
+    "get_question_stats": ([1, 2, 3],),
+    "get_hardest_questions": (10, 1),
+    "get_weakest_topics": (10, 1),
+    "get_revision_items": (["Python", "NumPy"],),
+    "get_topic_confidence": ("Python",),
+    "get_quiz_scores": (["Python", "NumPy"],),
+    "save_revision_items": ([("Python", 2.5, 1, 1, "2030-01-02", "2030-01-01", 4, 2.5, 0, 0, "2030-01-01")],),
+    "get_due_revisions": ("2030-01-01", 20),
+    "count_due_revisions": ("2030-01-01",),
+    "clear_revision_queue": (),
+    "get_analytics_stats": (),
+    "rebuild_stats": (),
+    "iter_logs": (("date", "confidence_score"),),
+    "iter_projects": (("id", "status"),),
+    "iter_monthly_assessments": (("month_str", "rating"),),
+    "iter_quiz_results": (("date", "score", "topic_covered"),),
+}
+
+# Connection / schema management, not queries
+SKIP = {"connection", "transaction", "close_all", "init_db", "schema_version", "set_tracing",
+        "write_version", "clear_read_cache", "learner_path", "use_database", "use_learner",
+        "current_database", "defer", "flush"}
+
+# "SCAN t" without an index (an FTS5 MATCH is an index), or a sort that can't use one.
+# Scans of a query's own VALUES list and of the CTEs built from it are fine.
+BAD_PLAN = re.compile(r"^SCAN \w+$|^SCAN \w+ (?!USING|VIRTUAL TABLE INDEX \d+:\S*M|CONSTANT ROWS$)|USE TEMP B-TREE")
+CTE = re.compile(r"^(?:CO-ROUTINE|MATERIALIZE) (\w+)$")
+QUERY = re.compile(r"^\s*(SELECT|UPDATE|DELETE|INSERT|WITH)\b", re.IGNORECASE)
+
+
+def seed(rows):
+    start = datetime.date(1900, 1, 1)
+    with db.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO daily_logs (date, topics_covered, revision_notes, confidence_score) VALUES (?, ?, ?, ?)",
+            (((start + datetime.timedelta(days=i)).strftime("%Y-%m-%d"), '["Python"]', "", i % 5 + 1) for i in range(rows)),
+        )
+        conn.execute(
+            "INSERT INTO log_topics (date, position, topic) SELECT date, 0, 'Python' FROM daily_logs")
+        conn.executemany(
+            "INSERT INTO weekly_goals (week_start_date, goal_text, day_num) VALUES (?, ?, ?)",
+            (((start + datetime.timedelta(weeks=i // 7)).strftime("%Y-%m-%d"), f"Day {i}: goal", i) for i in range(rows)),
+        )
+        conn.executemany(
+            "INSERT INTO projects (name, description, status, github_link) VALUES (?, ?, ?, ?)",
+            ((f"project {i}", "", ("Not Started", "In Progress", "Done")[i % 3], "") for i in range(rows)),
+        )
+        conn.execute("UPDATE projects SET roadmap_project_day = id WHERE id % 2 = 0")
+        conn.executemany(
+            "INSERT INTO monthly_assessments (month_str, reflection_text, rating) VALUES (?, ?, ?)",
+            ((f"{1900 + i // 12}-{i % 12 + 1:02d}", "", 5) for i in range(rows)),
+        )
+        conn.executemany(
+            "INSERT INTO quiz_results (date, score, total_questions, topic_covered) VALUES (?, ?, ?, ?)",
+            (((start + datetime.timedelta(days=i)).strftime("%Y-%m-%d"), 10, 15, "Python") for i in range(rows)),
+        )
+        conn.executemany(
+            "INSERT INTO question_bank (topic, difficulty, question, options, answer, tags) VALUES (?, ?, ?, ?, ?, ?)",
+            ((f"topic {i % 500}", ("Easy", "Medium", "Hard")[i % 3], f"Question {i} about topic {i % 500}?",
+              '["a", "b", "c", "d"]', "a", f"week{i % 24 + 1}") for i in range(rows)),
+        )
+        conn.executemany(
+            "INSERT INTO quiz_answers (date, question_id, topic, difficulty, chosen, is_correct) VALUES (?, ?, ?, ?, ?, ?)",
+            (((start + datetime.timedelta(days=i // 15)).strftime("%Y-%m-%d"), i + 1, f"topic {i % 500}",
+              ("Easy", "Medium", "Hard")[i % 3], "a", i % 2) for i in range(rows)),
+        )
+        conn.execute("INSERT INTO question_stats SELECT question_id, COUNT(*), SUM(is_correct) FROM quiz_answers GROUP BY question_id")
+        conn.execute("INSERT INTO topic_stats SELECT topic, COUNT(*), SUM(is_correct) FROM quiz_answers GROUP BY topic")
+        conn.execute("INSERT INTO difficulty_stats SELECT difficulty, COUNT(*), SUM(is_correct) FROM quiz_answers GROUP BY difficulty")
+        conn.executemany(
+            "INSERT INTO revision_queue (topic, ease, interval_days, repetitions, due_date) VALUES (?, 2.5, ?, 1, ?)",
+            ((f"topic {i}", i % 30 + 1, (start + datetime.timedelta(days=i)).strftime("%Y-%m-%d")) for i in range(rows)),
+        )
+    db.rebuild_stats()
+    with db.connection() as conn:
+        conn.execute("ANALYZE")
+
+
+def public_functions():
+    return sorted(
+        name for name, obj in vars(db).items()
+        if callable(obj) and not name.startswith("_")
+        and getattr(obj, "__module__", None) == db.__name__
+        and name not in SKIP
+    )
+
+
+def check(rows):
+    seed(rows)
+    failures = []
+    missing = [name for name in public_functions() if name not in CALLS]
+    for name in missing:
+        failures.append(f"{name}: no example call registered in CALLS")
+
+    for name in public_functions():
+        if name not in CALLS:
+            continue
+        statements = []
+        with db.connection() as conn:
+            # Streaming readers check out their own pooled connection; make
+            # sure the one they'll get is traced too.
+            spare = db._acquire(db.DB_NAME)
+            db._release(db.DB_NAME, spare)
+            for c in (conn, spare):
+                c.set_trace_callback(statements.append)
+            try:
+                result = getattr(db, name)(*CALLS[name])
+                if inspect.isgenerator(result):
+                    for _ in result:
+                        pass
+            finally:
+                for c in (conn, spare):
+                    c.set_trace_callback(None)
+            for sql in statements:
+                if not QUERY.match(sql):
+                    continue
+                plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql)]
+                ctes = {m.group(1) for m in map(CTE.match, plan) if m}
+                bad = [step for step in plan if BAD_PLAN.search(step) and step.split()[1] not in ctes]
+                status = "FAIL" if bad else "ok"
+                print(f"[{status}] {name}: {' '.join(sql.split())[:100]}")
+                for step in plan:
+                    print(f"         {step}")
+                if bad:
+                    failures.append(f"{name}: {'; '.join(bad)}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000, help="rows to seed per table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db.close_all()
+        db.READ_CACHE = False  # every call has to reach SQLite to be checked
+        db.DB_NAME = os.path.join(tmp, "plan_check.db")
+        db.init_db()
+        try:
+            failures = check(args.rows)
+        finally:
+            db.close_all()
+
+    if failures:
+        print("\nQuery plan check failed:")
+        for f in failures:
+            print(f"  - {f}")
+        sys.exit(1)
+    print("\nAll queries use indexes.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,87 +1,134 @@
 import random
+from typing import NamedTuple
 
-def generate_quiz(topic):
+# In a real app, this would call an LLM.
+# Here we use templates to create a "Self-Assessment" style quiz
+# where the user validates their knowledge against key concepts.
+
+# --- EASY (Concepts & Definitions) ---
+EASY_TEMPLATES = [
+    ("What is the primary definition of {topic}?", 
+     ["A fundamental concept in ML", "A type of database", "A python library", "A hardware component"], "A fundamental concept in ML"),
+    ("Which of the following best describes {topic}?", 
+     ["Supervised Learning technique", "Unsupervised Learning technique", "Reinforcement Learning", "It depends on context"], "It depends on context"),
+    ("When typically using {topic}, what is the first step?", 
+     ["Data Preprocessing", "Model Training", "Deployment", "Hyperparameter Tuning"], "Data Preprocessing"),
+    ("Basic syntax: How would you initialize {topic} in Python?", 
+     ["import {topic}", "new {topic}()", "It varies by library", "None of the above"], "It varies by library"),
+    ("True or False: {topic} is essential for deep learning.", 
+     ["True", "False", "Only for CNNs", "Only for NLP"], "True")
+]
+
+# --- MEDIUM (Application & Implementation) ---
+MEDIUM_TEMPLATES = [
+    ("How does {topic} handle overfitting?", 
+     ["By increasing complexity", "It doesn't directly", "Through regularization", "By using more data only"], "Through regularization"),
+    ("In the context of {topic}, what does the parameter 'alpha' usually control?", 
+     ["Learning Rate / Regularization", "Number of trees", "Tree depth", "Batch size"], "Learning Rate / Regularization"),
+    ("Which metric is most critical when evaluating {topic}?", 
+     ["Accuracy", "F1 Score", "MSE", "Context dependent"], "Context dependent"),
+    ("When implementing {topic}, a common pitfall is...", 
+     ["Data Leakage", "Syntax Error", "Computer crashing", "Too much RAM"], "Data Leakage"),
+    ("Comparing {topic} to a baseline, you should expect...", 
+     ["Better performance", "Faster training", "More interpretability", "Trade-offs"], "Trade-offs")
+]
+
+# --- HARD (Theory & Edge Cases) ---
+HARD_TEMPLATES = [
+    ("Deriving the gradient for {topic}, what is the mathematical basis?", 
+     ["Chain Rule", "Pythagoras Theorem", "Riemann Sum", "Fourier Transform"], "Chain Rule"),
+    ("In a high-dimensional space, how does {topic} behave?", 
+     ["Curse of Dimensionality applies", "It becomes faster", "No change", "It simplifies"], "Curse of Dimensionality applies"),
+    ("What is the asymptotic complexity (Big O) of training {topic}?", 
+     ["O(n log n)", "O(n^2)", "O(n^3)", "Depends on implementation"], "Depends on implementation"),
+    ("If {topic} fails to converge, the most likely theoretical reason is...", 
+     ["Learning rate too high", "Bad initialization", "Non-convex loss surface", "All of the above"], "All of the above"),
+    ("Advanced: How would you scale {topic} to 1TB of data?", 
+     ["Distributed Computing (Spark/Dask)", "Use more RAM", "Loop over files", "You can't"], "Distributed Computing (Spark/Dask)")
+]
+
+
+class Question(NamedTuple):
+    question: str
+    options: tuple
+    answer: str
+    difficulty: str
+
+
+# Options that only make sense in last place, so shuffling leaves them there
+_PINNED_LAST = ("All of the above", "None of the above")
+
+
+class _Template(NamedTuple):
+    question: tuple       # the question text split on "{topic}"
+    options: tuple        # the options, if none mentions the topic, else None
+    option_parts: tuple   # each option split on "{topic}"
+    answer: str
+    difficulty: str
+
+
+def _compile_templates():
+    # "{topic}" is the only placeholder, so splitting on it once here leaves
+    # a join per question instead of a str.format parse.
+    compiled = []
+    for difficulty, templates in (("Easy", EASY_TEMPLATES), ("Medium", MEDIUM_TEMPLATES), ("Hard", HARD_TEMPLATES)):
+        for question, options, answer in templates:
+            option_parts = tuple(tuple(o.split("{topic}")) for o in options)
+            static = tuple(options) if all(len(parts) == 1 for parts in option_parts) else None
+            compiled.append(_Template(tuple(question.split("{topic}")), static, option_parts, answer, difficulty))
+    return tuple(compiled)
+
+
+TEMPLATES = _compile_templates()  # 5 Easy, 5 Medium, 5 Hard
+QUIZ_LENGTH = len(TEMPLATES)
+
+
+def generate_quiz(topic, seed=None):
     """
     Generates a 15-question quiz based on the provided topic.
-    Returns a list of dictionaries.
+    Returns a list of Question tuples (5 Easy, then 5 Medium, then 5 Hard).
+
+    With a seed, each question's options are shuffled exactly as
+    from_bank_rows() shuffles them for the same seed; the same (topic, seed)
+    always gives the same quiz. Without one, options keep template order.
     """
-    
-    # In a real app, this would call an LLM. 
-    # Here we use templates to create a "Self-Assessment" style quiz 
-    # where the user validates their knowledge against key concepts.
-    
     questions = []
-    
-    # --- EASY (Concepts & Definitions) ---
-    easy_templates = [
-        ("What is the primary definition of {topic}?", 
-         ["A fundamental concept in ML", "A type of database", "A python library", "A hardware component"], "A fundamental concept in ML"),
-        ("Which of the following best describes {topic}?", 
-         ["Supervised Learning technique", "Unsupervised Learning technique", "Reinforcement Learning", "It depends on context"], "It depends on context"),
-        ("When typically using {topic}, what is the first step?", 
-         ["Data Preprocessing", "Model Training", "Deployment", "Hyperparameter Tuning"], "Data Preprocessing"),
-        ("Basic syntax: How would you initialize {topic} in Python?", 
-         ["import {topic}", "new {topic}()", "It varies by library", "None of the above"], "It varies by library"),
-        ("True or False: {topic} is essential for deep learning.", 
-         ["True", "False", "Only for CNNs", "Only for NLP"], "True")
-    ]
-    
-    # --- MEDIUM (Application & Implementation) ---
-    medium_templates = [
-        ("How does {topic} handle overfitting?", 
-         ["By increasing complexity", "It doesn't directly", "Through regularization", "By using more data only"], "Through regularization"),
-        ("In the context of {topic}, what does the parameter 'alpha' usually control?", 
-         ["Learning Rate / Regularization", "Number of trees", "Tree depth", "Batch size"], "Learning Rate / Regularization"),
-        ("Which metric is most critical when evaluating {topic}?", 
-         ["Accuracy", "F1 Score", "MSE", "Context dependent"], "Context dependent"),
-        ("When implementing {topic}, a common pitfall is...", 
-         ["Data Leakage", "Syntax Error", "Computer crashing", "Too much RAM"], "Data Leakage"),
-        ("Comparing {topic} to a baseline, you should expect...", 
-         ["Better performance", "Faster training", "More interpretability", "Trade-offs"], "Trade-offs")
-    ]
-    
-    # --- HARD (Theory & Edge Cases) ---
-    hard_templates = [
-        ("Deriving the gradient for {topic}, what is the mathematical basis?", 
-         ["Chain Rule", "Pythagoras Theorem", "Riemann Sum", "Fourier Transform"], "Chain Rule"),
-        ("In a high-dimensional space, how does {topic} behave?", 
-         ["Curse of Dimensionality applies", "It becomes faster", "No change", "It simplifies"], "Curse of Dimensionality applies"),
-        ("What is the asymptotic complexity (Big O) of training {topic}?", 
-         ["O(n log n)", "O(n^2)", "O(n^3)", "Depends on implementation"], "Depends on implementation"),
-        ("If {topic} fails to converge, the most likely theoretical reason is...", 
-         ["Learning rate too high", "Bad initialization", "Non-convex loss surface", "All of the above"], "All of the above"),
-        ("Advanced: How would you scale {topic} to 1TB of data?", 
-         ["Distributed Computing (Spark/Dask)", "Use more RAM", "Loop over files", "You can't"], "Distributed Computing (Spark/Dask)")
-    ]
-    
-    # Generate 5 Easy
-    for t in easy_templates:
-        q_text = t[0].format(topic=topic)
-        questions.append({
-            "question": q_text,
-            "options": t[1],
-            "answer": t[2],
-            "difficulty": "Easy"
-        })
-        
-    # Generate 5 Medium
-    for t in medium_templates:
-        q_text = t[0].format(topic=topic)
-        questions.append({
-            "question": q_text,
-            "options": t[1],
-            "answer": t[2],
-            "difficulty": "Medium"
-        })
-        
-    # Generate 5 Hard
-    for t in hard_templates:
-        q_text = t[0].format(topic=topic)
-        questions.append({
-            "question": q_text,
-            "options": t[1],
-            "answer": t[2],
-            "difficulty": "Hard"
-        })
-        
+    for t in TEMPLATES:
+        question = topic.join(t.question)
+        options = t.options or tuple([topic.join(parts) for parts in t.option_parts])
+        if seed is not None:
+            options = _shuffled(options, seed, question)
+        questions.append(Question(question, options, t.answer, t.difficulty))
     return questions
+
+
+def generate_quizzes(topics, seed=None):
+    """Quizzes for many topics at once (e.g. every week or day title of a plan).
+
+    Returns {topic: questions}. Each topic's quiz is exactly what
+    generate_quiz(topic, seed) returns, whatever else is in the batch.
+    """
+    return {topic: generate_quiz(topic, seed) for topic in dict.fromkeys(topics)}
+
+
+def to_bank_rows(topic, questions, tags=""):
+    """(topic, difficulty, question, options, answer, tags) rows for database.add_questions()."""
+    return [(topic, q.difficulty, q.question, q.options, q.answer, tags) for q in questions]
+
+
+def _shuffled(options, seed, question):
+    # Keyed on the question too, so its order doesn't depend on what else was drawn
+    free = [o for o in options if o not in _PINNED_LAST]
+    random.Random(f"{seed}:{question}").shuffle(free)
+    return tuple(free + [o for o in options if o in _PINNED_LAST])
+
+
+def from_bank_rows(rows, seed=None):
+    """Questions from database.get_quiz_questions() / search_questions() rows.
+
+    The bank keeps options in template order. With a seed (e.g. the date)
+    each question's options are shuffled at draw time, the same way for the
+    same (seed, question); without one they keep the bank's order.
+    """
+    return [Question(question, options if seed is None else _shuffled(options, seed, question), answer, difficulty)
+            for _, _, difficulty, question, options, answer, *_ in rows]
@@ -0,0 +1,159 @@
+"""Precompiled lookups over a roadmap plan (see roadmap.py), built once per plan.
+
+The plan files list weeks, then days. The pages need it the other way round
+("what is day 57?", "which days teach Backpropagation?"), so each plan is
+compiled into a Plan with:
+
+- days: a tuple indexed by day number (days[0] is None) of compact Day records
+- week_ranges: week number -> range of the day numbers listed under that week
+- topic_days: topic -> tuple of the day numbers that cover it
+
+Days are looked up by number directly, not through (day_num - 1) // 7 + 1:
+weeks don't have to hold exactly 7 days (in the 24-week plan, week 23 lists
+no days and week 24 lists days 155-168).
+
+Compiled plans are pickled to roadmaps/.cache, keyed by a hash of the plan
+file, so a process start only hashes the file and unpickles it. Editing the
+file changes the hash and the plan is recompiled on next load.
+"""
+import hashlib
+import os
+import pickle
+import threading
+
+import roadmap
+
+CACHE_DIR = os.path.join(roadmap.ROADMAP_DIR, ".cache")
+CACHE_FORMAT = 1  # bump whenever Day or Plan change shape
+
+
+class Day:
+    __slots__ = ("number", "week", "title", "topics", "kind")
+
+    def __init__(self, number, week, title, topics, kind):
+        self.number = number
+        self.week = week
+        self.title = title
+        self.topics = topics
+        self.kind = kind  # "study", "revision" (6th day of a week) or "project" (7th)
+
+    def __repr__(self):
+        return f"Day({self.number}, week={self.week}, title={self.title!r})"
+
+
+def _day_kind(day_num):
+    if day_num % 7 == 6:
+        return "revision"
+    if day_num % 7 == 0:
+        return "project"
+    return "study"
+
+
+class Plan:
+    __slots__ = ("id", "title", "description", "days", "week_ranges", "topic_days", "week_titles",
+                 "projects", "total_days", "total_weeks", "all_topics")
+
+    def __init__(self, data):
+        """Compiles a plan dict as returned by roadmap.parse()."""
+        self.id = data["id"]
+        self.title = data["title"]
+        self.description = data.get("description", "")
+        days = [None]
+        self.week_ranges = {}
+        self.week_titles = {}
+        for week in data["weeks"]:
+            numbers = [day["day"] for day in week["days"]]
+            self.week_ranges[week["week"]] = range(numbers[0], numbers[-1] + 1) if numbers else range(0)
+            self.week_titles[week["week"]] = week["title"]
+            for day in week["days"]:
+                days.append(Day(day["day"], week["week"], day["title"], tuple(day["topics"]), _day_kind(day["day"])))
+        self.days = tuple(days)
+        self.total_days = len(days) - 1
+        self.total_weeks = len(self.week_titles)
+
+        topic_days = {}
+        for day in days[1:]:
+            for topic in day.topics:
+                topic_days.setdefault(topic, []).append(day.number)
+        self.topic_days = {topic: tuple(numbers) for topic, numbers in topic_days.items()}
+        self.all_topics = frozenset(self.topic_days)
+        # day -> {"title", "description", "features"}, as in roadmap.ML_PROJECTS
+        self.projects = roadmap.legacy_shape(data)[1]
+
+    def day(self, day_num):
+        """The Day record for a 1-based day number, or None outside the plan."""
+        if 1 <= day_num <= self.total_days:
+            return self.days[day_num]
+        return None
+
+    def week_title(self, week_num, default=None):
+        return self.week_titles.get(week_num, default)
+
+    def week_days(self, week_num):
+        """Day records listed under a week (empty for weeks without days)."""
+        return [self.days[n] for n in self.week_ranges.get(week_num, ())]
+
+    def days_for_topic(self, topic):
+        return self.topic_days.get(topic, ())
+
+
+def day_number(start_date, date):
+    """1-based roadmap day that `date` falls on for a roadmap started on `start_date`."""
+    return (date - start_date).days + 1
+
+
+def _cache_path(plan_id, raw):
+    digest = hashlib.sha256(raw).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{plan_id}-{digest}-v{CACHE_FORMAT}.pickle")
+
+
+def compile_plan(plan_id):
+    """Loads a plan, from the pickle cache when the file hasn't changed."""
+    raw = roadmap.read(plan_id)
+    path = _cache_path(plan_id, raw)
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        pass
+
+    plan = Plan(roadmap.parse(raw, plan_id))
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(plan, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        # Drop compiled copies of older versions of this file
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith(f"{plan_id}-") and name.endswith(".pickle") and name != os.path.basename(path):
+                os.remove(os.path.join(CACHE_DIR, name))
+    except OSError:
+        pass  # read-only install: just compile on every start
+    return plan
+
+
+_plans_lock = threading.Lock()
+_plans = {}  # plan id -> Plan, compiled once per process
+
+
+def get(plan_id=None):
+    """The compiled plan `plan_id` (default: roadmap.DEFAULT_PLAN).
+
+    Unknown ids (e.g. a plan file that was removed) fall back to the default.
+    """
+    plan_id = plan_id or roadmap.DEFAULT_PLAN
+    plan = _plans.get(plan_id)
+    if plan is not None:
+        return plan
+    if plan_id != roadmap.DEFAULT_PLAN and plan_id not in roadmap.plan_ids():
+        return get(None)
+    with _plans_lock:
+        if plan_id not in _plans:
+            _plans[plan_id] = compile_plan(plan_id)
+        return _plans[plan_id]
+
+
+def plans():
+    """Every available plan, compiled, in plan_ids() order."""
+    return [get(plan_id) for plan_id in roadmap.plan_ids()]
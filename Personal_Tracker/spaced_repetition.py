@@ -0,0 +1,161 @@
+"""Spaced-repetition revision schedule over roadmap topics (SM-2).
+
+A topic joins the queue the first time a log covers it. Every later showing
+is a review graded 0-5, SM-2 style:
+
+- a log grades the topics it covers (and any due topics ticked as revised)
+  with the day's confidence score (1-5)
+- a quiz grades the topics of its week that are already in the queue with
+  round(5 * score / total)
+
+Grades of 3 and up count as recalled: the interval grows 1 day, 6 days, then
+by the topic's ease factor, up to a year. Lower grades start the topic over at 1 day. The
+ease factor moves with every grade and never drops below 1.3.
+
+The schedule lives in the revision_queue table, indexed on due_date, so
+"what should I revise today" is an index range read of the due rows and
+never rescans the logs. A topic is reviewed at most once a day: a second
+review on the same day is recomputed from the state before the first one,
+with the lower of the two grades.
+
+Reviews usually arrive in date order and are scheduled straight from the
+topic's row. A review dated on or before the topic's last one (e.g. a
+re-saved log) and a topic's first review (a quiz earlier that day may
+already cover it) replay that topic's logs and quizzes instead, so the
+queue matches what rebuild() computes from the same history. Due topics
+ticked as revised aren't stored with the log, so a replay, like rebuild(),
+doesn't see earlier ticks.
+"""
+import datetime
+
+import database as db
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+PASSING_QUALITY = 3
+MAX_INTERVAL_DAYS = 365  # reviews well before the due date still multiply the interval
+
+
+def quality_from_confidence(confidence):
+    return max(0, min(5, int(confidence)))
+
+
+def quality_from_score(score, total):
+    return round(5 * score / total) if total else 0
+
+
+def schedule(item, topic, quality, date):
+    """The revision_queue row for `topic` after a review graded `quality` on `date`.
+
+    `item` is the topic's current row (database.REVISION_COLUMNS order), or
+    None for a topic seen for the first time.
+    """
+    if item is None:
+        ease, interval, repetitions, due = DEFAULT_EASE, 0, 0, date
+    elif item[5] == date:
+        # Already reviewed today: redo it from the state before that review
+        ease, interval, repetitions, due = item[7:11]
+        quality = min(quality, item[6])
+    else:
+        ease, interval, repetitions, due = item[1:5]
+    previous = (ease, interval, repetitions, due)
+
+    if quality >= PASSING_QUALITY:
+        interval = 1 if repetitions == 0 else 6 if repetitions == 1 else min(MAX_INTERVAL_DAYS, round(interval * ease))
+        repetitions += 1
+    else:
+        interval, repetitions = 1, 0
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    due = (datetime.date.fromisoformat(date) + datetime.timedelta(days=interval)).isoformat()
+    return (topic, ease, interval, repetitions, due, date, quality) + previous
+
+
+def _week_topics(plan, week):
+    return [topic for day in plan.week_days(week) for topic in day.topics]
+
+
+def _history(topic, plan):
+    """(date, quality, known_only) reviews of `topic` on record: its logs and its weeks' quizzes."""
+    weeks = sorted({plan.days[n].week for n in plan.days_for_topic(topic)})
+    reviews = [(date, quality_from_confidence(confidence), False)
+               for date, confidence in db.get_topic_confidence(topic)]
+    reviews += [(date, quality_from_score(score, total), True)
+                for date, score, total in db.get_quiz_scores([plan.week_title(w) for w in weeks])]
+    return reviews
+
+
+def _replay(topic, reviews):
+    # By date, a day's log before its quiz (as rebuild() goes)
+    item = None
+    for date, quality, known_only in sorted(reviews, key=lambda r: (r[0], r[2])):
+        if item is not None or not known_only:
+            item = schedule(item, topic, quality, date)
+    return item
+
+
+def review(date, topics, quality, plan, known_only=False):
+    """Grades `topics` on `date` ('YYYY-MM-DD'). With known_only, topics not yet in the queue are skipped."""
+    topics = list(dict.fromkeys(topics))
+    if not topics:
+        return
+    with db.transaction():
+        items = db.get_revision_items(topics)
+        rows = []
+        for topic in topics:
+            item = items.get(topic)
+            if item is None and known_only:
+                continue
+            if item is None or date <= item[5]:
+                # Out of order: replay the topic's history, this review included
+                item = _replay(topic, _history(topic, plan) + [(date, quality, known_only)])
+            else:
+                item = schedule(item, topic, quality, date)
+            if item is not None:
+                rows.append(item)
+        db.save_revision_items(rows)
+
+
+def review_log(date, topics, confidence, plan):
+    review(date, topics, quality_from_confidence(confidence), plan)
+
+
+def review_quiz(date, plan, week, score, total):
+    """Grades the week's topics that have been studied with the quiz score."""
+    review(date, _week_topics(plan, week), quality_from_score(score, total), plan, known_only=True)
+
+
+def due(date, limit=20):
+    """(topic, due_date, interval_days, repetitions) due by `date`, most overdue first."""
+    return db.get_due_revisions(date, limit)
+
+
+def rebuild(plan):
+    """Recomputes the queue by replaying every log and quiz, oldest first.
+
+    Quizzes are matched to `plan` weeks by their topic (the week title). The
+    schedule is built in memory and written back in one go.
+    """
+    week_numbers = {title: week for week, title in plan.week_titles.items()}
+    logs = dict(db.iter_logs(("date", "confidence_score"), newest_first=False))
+    quizzes = {date: (score, total, topic)
+               for date, score, total, topic in db.iter_quiz_results(("date", "score", "total_questions", "topic_covered"))}
+    dates = sorted(logs.keys() | quizzes.keys())
+    items = {}
+    with db.transaction():
+        for start in range(0, len(dates), db.DEFAULT_CHUNK_SIZE):
+            chunk = dates[start:start + db.DEFAULT_CHUNK_SIZE]
+            topics = db.get_topics_for_dates([date for date in chunk if date in logs])
+            for date in chunk:
+                if logs.get(date) is not None:
+                    quality = quality_from_confidence(logs[date])
+                    for topic in dict.fromkeys(topics.get(date, ())):
+                        items[topic] = schedule(items.get(topic), topic, quality, date)
+                if date in quizzes:
+                    score, total, title = quizzes[date]
+                    if title in week_numbers:
+                        quality = quality_from_score(score, total)
+                        for topic in dict.fromkeys(_week_topics(plan, week_numbers[title])):
+                            if topic in items:
+                                items[topic] = schedule(items[topic], topic, quality, date)
+        db.clear_revision_queue()
+        db.save_revision_items(items.values())
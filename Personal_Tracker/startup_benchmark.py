@@ -0,0 +1,119 @@
+"""Cold-start timings for the app.
+
+Each measurement runs in a fresh interpreter, so nothing is already in
+sys.modules: first the modules app.py imports before it renders anything,
+then the first visit to each page (importing its views module on top),
+then that page's first render against an empty database, which includes
+whatever the page only imports when it draws (e.g. a charting library).
+
+    python startup_benchmark.py --runs 10 --out startup.json
+    python startup_benchmark.py --compare startup.json
+    python startup_benchmark.py --detail views.analytics
+
+--detail runs `python -X importtime` for one target and lists the slowest
+top-level imports it pulled in. Output and --compare work like benchmark.py.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+from benchmark import compare, summarize
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# What app.py imports at module level, before a page is chosen
+STARTUP_IMPORTS = ("streamlit", "database", "instrumentation")
+VIEWS = ("dashboard", "log_progress", "daily_quiz", "goals", "projects", "analytics", "settings", "diagnostics")
+
+# Rendering outside `streamlit run` (bare mode) draws nothing but runs the
+# page's code, imports included; Streamlit logs warnings to stderr for it
+PROBE = """
+import time
+start = time.perf_counter()
+import {startup}
+startup = time.perf_counter()
+import views.{view}
+page = time.perf_counter()
+database.DB_NAME = {db_path!r}
+database.init_db()
+render = time.perf_counter()
+views.{view}.render()
+print(startup - start, page - startup, time.perf_counter() - render)
+"""
+
+
+def measure(view, db_path):
+    """(startup, first page visit, first render) seconds in a fresh interpreter."""
+    code = PROBE.format(startup=", ".join(STARTUP_IMPORTS), view=view, db_path=db_path)
+    out = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True, check=True)
+    startup, page, render = out.stdout.split()[-3:]
+    return float(startup), float(page), float(render)
+
+
+def importtime(module, top):
+    """Slowest imports (cumulative microseconds, nested ones included) under module."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                         cwd=APP_DIR, capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented under the module that imported them
+        if name.startswith("   "):
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--out", help="also write the JSON lines to this file")
+    parser.add_argument("--compare", help="JSON lines file from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.5, help="slowdown ratio that counts as a regression")
+    parser.add_argument("--detail", metavar="MODULE", help="print -X importtime's slowest imports for MODULE and exit")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    if args.detail:
+        for cumulative, name in importtime(args.detail, args.top):
+            print(f"{cumulative / 1000:9.1f} ms  {name}")
+        return
+
+    meta = {"meta": True, "python": platform.python_version(), "platform": platform.platform()}
+    results = [meta]
+    print(json.dumps(meta))
+
+    startup_runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "startup.db")
+        for view in VIEWS:
+            runs = [measure(view, db_path) for _ in range(args.runs)]
+            startup_runs += [startup for startup, _, _ in runs]
+            results.append(summarize(None, f"first visit:{view}", [page for _, page, _ in runs]))
+            print(json.dumps(results[-1]), flush=True)
+            results.append(summarize(None, f"first render:{view}", [render for _, _, render in runs]))
+            print(json.dumps(results[-1]), flush=True)
+    results.append(summarize(None, "startup", startup_runs))
+    print(json.dumps(results[-1]))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            for r in results:
+                f.write(json.dumps(r) + "\n")
+
+    if args.compare:
+        regressions = compare(results[1:], args.compare, args.threshold)
+        if regressions:
+            print("\nRegressions:", file=sys.stderr)
+            for line in regressions:
+                print(f"  - {line}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Concurrency stress run for the storage layer.
+
+Starts N writer threads (Log Progress / Goals style writes) and N reader
+threads (Dashboard / Analytics style reads) against a scratch database and
+reports throughput, reader latency and any "database is locked" errors.
+
+    python stress.py --writers 8 --readers 8 --seconds 10
+
+With --learners N, thread i works on learner i % N's own database (as a
+multi-learner server would) and the run also checks that no learner's
+database received another learner's writes.
+
+    python stress.py --writers 200 --readers 200 --learners 100
+
+With --write-behind, writers queue the same writes with db.defer() (one
+writer thread, group commits) and then read them back, as a page does on
+its rerun; a write its writer can't see yet counts as an error.
+"""
+import argparse
+import datetime
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import database as db
+
+
+def writer(worker_id, stop, stats, learner=None, slot=None, deferred=False):
+    db.use_learner(learner)
+    # Writers sharing a database log on separate date ranges
+    slot = worker_id if slot is None else slot
+    day = datetime.date(2000, 1, 1) + datetime.timedelta(days=slot * 100000)
+    n = 0
+    while not stop.is_set():
+        try:
+            date_str = (day + datetime.timedelta(days=n)).strftime("%Y-%m-%d")
+            if deferred:
+                db.defer(db.add_daily_log, date_str, ["Python"], "", n % 5 + 1)
+                db.defer(db.set_setting, f"stress_{worker_id}", str(n))
+                # Then rerun the page, which must see the write (read-your-writes)
+                if db.get_setting(f"stress_{worker_id}") != str(n):
+                    stats["errors"].append("deferred write not visible to its writer")
+            else:
+                db.add_daily_log(date_str, ["Python"], "", n % 5 + 1)
+                db.set_setting(f"stress_{worker_id}", str(n))
+            stats["writes"] += 2
+        except sqlite3.OperationalError as e:
+            stats["errors"].append(str(e))
+        n += 1
+
+
+def reader(stop, stats, learner=None):
+    db.use_learner(learner)
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            db.get_analytics_stats()
+            db.get_setting("roadmap_start_date")
+            db.get_weekly_goals("2000-01-03")
+        except sqlite3.OperationalError as e:
+            stats["errors"].append(str(e))
+            continue
+        stats["latencies"].append(time.perf_counter() - start)
+        stats["reads"] += 1
+
+
+def learner_of(thread_id, learners):
+    return f"learner{thread_id % learners}" if learners else None
+
+
+def check_isolation(writers, learners):
+    """Learners holding another learner's writer settings (should be none)."""
+    leaks = []
+    for n in range(learners):
+        db.use_learner(f"learner{n}")
+        leaks += [f"learner{n}: stress_{i}" for i in range(writers)
+                  if learner_of(i, learners) != f"learner{n}" and db.get_setting(f"stress_{i}") is not None]
+    db.use_learner(None)
+    return leaks
+
+
+def run(writers, readers, seconds, path, learners=0, deferred=False):
+    db.close_all()
+    db.DB_NAME = path
+    db.LEARNERS_DIR = os.path.join(os.path.dirname(path), "learners")
+    for n in range(learners):
+        db.use_learner(f"learner{n}")
+        db.init_db()
+    db.use_learner(None)
+    db.init_db()
+
+    # Counters are only ever incremented by one thread each, so keep one
+    # dict per thread and merge at the end.
+    stop = threading.Event()
+    write_stats = [{"writes": 0, "errors": []} for _ in range(writers)]
+    read_stats = [{"reads": 0, "errors": [], "latencies": []} for _ in range(readers)]
+    threads = [threading.Thread(target=writer,
+                                args=(i, stop, s, learner_of(i, learners), i // max(learners, 1), deferred))
+               for i, s in enumerate(write_stats)]
+    threads += [threading.Thread(target=reader, args=(stop, s, learner_of(i, learners)))
+                for i, s in enumerate(read_stats)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    try:
+        db.flush()
+    except sqlite3.OperationalError as e:
+        write_stats[0]["errors"].append(str(e))
+    leaks = check_isolation(writers, learners)
+    db.close_all()
+
+    latencies = sorted(l for s in read_stats for l in s["latencies"])
+    errors = [e for s in write_stats + read_stats for e in s["errors"]]
+    return {
+        "writers": writers,
+        "readers": readers,
+        "learners": learners,
+        "write_behind": deferred,
+        "seconds": seconds,
+        "writes_per_sec": round(sum(s["writes"] for s in write_stats) / seconds, 1),
+        "reads_per_sec": round(sum(s["reads"] for s in read_stats) / seconds, 1),
+        "read_p50_ms": round(latencies[len(latencies) // 2] * 1000, 2) if latencies else None,
+        "read_p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 2) if latencies else None,
+        "read_max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:5],
+        "isolation_leaks": leaks[:5],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--learners", type=int, default=0, help="spread threads over this many learner databases")
+    parser.add_argument("--write-behind", action="store_true", help="queue writes with db.defer()")
+    parser.add_argument("--db", help="database file to use (default: a temporary file)")
+    args = parser.parse_args()
+
+    if args.db:
+        result = run(args.writers, args.readers, args.seconds, args.db, args.learners, args.write_behind)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run(args.writers, args.readers, args.seconds, os.path.join(tmp, "stress.db"),
+                         args.learners, args.write_behind)
+    print(json.dumps(result, indent=2))
+    raise SystemExit(1 if result["errors"] or result["isolation_leaks"] else 0)
+
+
+if __name__ == "__main__":
+    main()
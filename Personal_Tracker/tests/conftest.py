@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database as db  # noqa: E402
+
+
+@pytest.fixture
+def tracker_db(tmp_path, monkeypatch):
+    """database.py pointed at a fresh, migrated scratch file."""
+    db.close_all()
+    monkeypatch.setattr(db, "DB_NAME", str(tmp_path / "tracker.db"))
+    monkeypatch.setattr(db, "LEARNERS_DIR", str(tmp_path / "learners"))
+    db.init_db()
+    yield db
+    db.flush()
+    db.close_all()
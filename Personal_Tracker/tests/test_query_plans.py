@@ -0,0 +1,6 @@
+import query_plan_check
+
+
+def test_every_query_uses_an_index(tracker_db, monkeypatch):
+    monkeypatch.setattr(tracker_db, "READ_CACHE", False)
+    assert query_plan_check.check(500) == []
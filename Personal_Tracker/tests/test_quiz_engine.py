@@ -0,0 +1,41 @@
+import datetime
+
+import quiz_engine
+import roadmap_index
+from views import settings
+
+
+def bank_rows(topic):
+    questions = quiz_engine.generate_quiz(topic)
+    return [(n, topic) + tuple(row[1:]) for n, row in enumerate(quiz_engine.to_bank_rows(topic, questions))]
+
+
+def test_banked_options_are_shuffled_per_day():
+    rows = bank_rows("Backpropagation")
+    today = quiz_engine.from_bank_rows(rows, seed="2026-10-18")
+    assert quiz_engine.from_bank_rows(rows, seed="2026-10-18") == today
+    assert quiz_engine.from_bank_rows(rows, seed="2026-10-19") != today
+    assert [q.options for q in quiz_engine.from_bank_rows(rows)] == [row[4] for row in rows]
+    for q, row in zip(today, rows):
+        assert sorted(q.options) == sorted(row[4]) and q.answer in q.options
+        if "All of the above" in row[4]:
+            assert q.options[-1] == "All of the above"
+    # Not always the first option any more
+    assert len({q.options.index(q.answer) for q in today}) > 1
+
+
+def test_seeded_quiz_matches_the_banked_draw():
+    rows = bank_rows("Backpropagation")
+    assert quiz_engine.generate_quiz("Backpropagation", seed=7) == quiz_engine.from_bank_rows(rows, seed=7)
+
+
+def test_regenerating_the_roadmap_banks_nothing_new(tracker_db, monkeypatch):
+    plan = roadmap_index.get()
+    monkeypatch.setattr(settings, "current_plan", lambda: plan)
+    settings.initialize_roadmap(datetime.date(2026, 1, 5), plan)
+    banked = tracker_db.count_questions()
+    assert tracker_db.get_banked_topics([plan.week_title(1), "Not a title"]) == {plan.week_title(1)}
+    calls = []
+    monkeypatch.setattr(quiz_engine, "generate_quizzes", lambda topics: calls.append(topics) or {})
+    settings.initialize_roadmap(datetime.date(2026, 2, 2), plan)
+    assert calls == [[]] and tracker_db.count_questions() == banked
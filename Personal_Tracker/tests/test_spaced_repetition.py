@@ -0,0 +1,69 @@
+"""Incremental revision scheduling must match rebuild() over the same history."""
+import datetime
+import random
+
+import roadmap_index
+import spaced_repetition
+
+START = datetime.date(2026, 1, 5)
+
+
+def queue(db, plan):
+    return db.get_revision_items(sorted(plan.all_topics))
+
+
+def log(db, plan, day, confidence):
+    date = (START + datetime.timedelta(days=day - 1)).isoformat()
+    topics = list(plan.day(day).topics)
+    with db.transaction():
+        db.add_daily_log(date, topics, "", confidence)
+        spaced_repetition.review_log(date, topics, confidence, plan)
+
+
+def quiz(db, plan, day, score):
+    date = (START + datetime.timedelta(days=day - 1)).isoformat()
+    week = plan.day(day).week
+    with db.transaction():
+        db.add_quiz_result(date, score, 15, plan.week_title(week))
+        spaced_repetition.review_quiz(date, plan, week, score, 15)
+
+
+def test_resaving_an_older_log_is_not_a_new_review(tracker_db):
+    plan = roadmap_index.get()
+    topic = plan.day(1).topics[0]
+    log(tracker_db, plan, 1, 4)
+    quiz(tracker_db, plan, 3, 15)  # week 1's quiz reviews the topic again
+    before = queue(tracker_db, plan)[topic]
+    log(tracker_db, plan, 1, 4)
+    assert queue(tracker_db, plan)[topic] == before
+
+
+def test_incremental_matches_rebuild(tracker_db):
+    plan = roadmap_index.get()
+    rng = random.Random(20)
+    quizzed = set()
+    # Days mostly in date order, with re-saves of the same and older days
+    # and the odd back-filled day or quiz
+    day = 1
+    for _ in range(150):
+        if rng.random() < 0.25:
+            target = rng.randint(max(1, day - 10), day)
+        else:
+            day = min(day + 1, 40)
+            target = day
+        if rng.random() < 0.2 and target not in quizzed:
+            quizzed.add(target)
+            quiz(tracker_db, plan, target, rng.randint(0, 15))
+        else:
+            log(tracker_db, plan, target, rng.randint(1, 5))
+        incremental = queue(tracker_db, plan)
+        spaced_repetition.rebuild(plan)
+        assert queue(tracker_db, plan) == incremental, target
+
+
+def test_daily_reviews_stop_growing_the_interval_at_a_year():
+    item = None
+    day = datetime.date(2020, 1, 1)
+    for n in range(200):
+        item = spaced_repetition.schedule(item, "Vectors", 5, (day + datetime.timedelta(days=n)).isoformat())
+    assert item[2] == spaced_repetition.MAX_INTERVAL_DAYS
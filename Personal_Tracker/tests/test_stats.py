@@ -0,0 +1,68 @@
+"""learner_stats, the quiz answer totals and the activity rollups, kept
+current by the write path, must match what rebuild_stats() recomputes from
+the tables."""
+import datetime
+import random
+
+STATUSES = ("Not Started", "In Progress", "Done")
+
+
+DERIVED_TABLES = ("learner_stats", "daily_rollup", "weekly_rollup", "question_stats", "topic_stats", "difficulty_stats")
+
+
+def snapshot(db):
+    return (db._stats_row(), db.get_daily_rollup("0001-01-01", "9999-12-31"), db.get_weekly_rollup(),
+            db.get_difficulty_stats(), db.get_question_stats(list(range(1, 6))), db.get_weakest_topics())
+
+
+def random_writes(db, rng, n):
+    start = datetime.date(2026, 1, 1)
+    projects = []
+    for _ in range(n):
+        action = rng.random()
+        if action < 0.6:
+            date = (start + datetime.timedelta(days=rng.randint(0, 60))).isoformat()
+            topics = rng.sample(["Python", "NumPy", "Pandas", "Statistics"], rng.randint(0, 3))
+            db.add_daily_log(date, topics, "", rng.choice([None, 1, 2, 3, 4, 5]))
+        elif action < 0.75:
+            date = (start + datetime.timedelta(days=rng.randint(0, 60))).isoformat()
+            db.add_quiz_result(date, rng.randint(0, 15), 15, "Python")
+            db.add_quiz_answers(date, [(rng.choice([None, 1, 2, 3, 4, 5]), rng.choice(["Python", "NumPy"]),
+                                        rng.choice(["Easy", "Hard"]), "a", rng.random() < 0.5) for _ in range(3)])
+        elif action < 0.85 or not projects:
+            db.add_project(f"project {len(projects)}", "", rng.choice(STATUSES), "")
+            projects.append(len(projects) + 1)
+        elif action < 0.95:
+            db.update_project_status(rng.choice(projects), rng.choice(STATUSES))
+        else:
+            db.delete_project(rng.choice(projects))
+
+
+def test_incremental_stats_match_rebuild(tracker_db):
+    random_writes(tracker_db, random.Random(5), 200)
+    incremental = snapshot(tracker_db)
+    # As if the source rows had been imported directly
+    with tracker_db.transaction() as conn:
+        for table in DERIVED_TABLES:
+            conn.execute(f"DELETE FROM {table}")
+    tracker_db.rebuild_stats()
+    assert snapshot(tracker_db) == incremental
+
+
+def test_streaks_match_full_recount_after_every_write(tracker_db):
+    # Dates mostly within a month, in random order, so most writes back-fill
+    # a day between (or joining) existing runs
+    rng = random.Random(6)
+    start = datetime.date(2026, 1, 1)
+    for _ in range(400):
+        date = (start + datetime.timedelta(days=rng.randint(0, 40))).isoformat()
+        tracker_db.add_daily_log(date, ["Python"], "", rng.randint(1, 5))
+        incremental = tracker_db._stats_row()
+        tracker_db.rebuild_stats()
+        assert tracker_db._stats_row() == incremental, date
+
+
+def test_add_project_counts_only_new_roadmap_days(tracker_db):
+    assert tracker_db.add_project("Project", "", "Done", "", 7) == 1
+    assert tracker_db.add_project("Project", "", "Done", "", 7) == 0
+    assert tracker_db.get_analytics_stats()["projects_done"] == 1
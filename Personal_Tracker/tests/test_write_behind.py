@@ -0,0 +1,74 @@
+import datetime
+import sqlite3
+import threading
+
+import pytest
+
+
+def test_streaming_reads_see_deferred_writes(tracker_db):
+    for n in range(50):
+        date = (datetime.date(2026, 1, 1) + datetime.timedelta(days=n)).isoformat()
+        tracker_db.defer(tracker_db.add_daily_log, date, ["Python"], "", 3)
+        assert next(tracker_db.iter_logs(("date",))) == (date,)
+
+
+def in_other_session(fn):
+    # Each thread is its own session, as each Streamlit script run is
+    result = []
+    thread = threading.Thread(target=lambda: result.append(fn()))
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive(), "blocked on another session's writes"
+    return result[0]
+
+
+def test_failed_deferred_write_is_raised_by_the_session_that_queued_it(tracker_db):
+    def broken():
+        with tracker_db.transaction() as conn:
+            conn.execute("INSERT INTO no_such_table VALUES (1)")
+
+    tracker_db.defer(broken)
+    tracker_db.defer(tracker_db.set_setting, "after", "1")
+    tracker_db._await_all_writes()
+
+    assert in_other_session(lambda: tracker_db.get_setting("after")) == "1"  # not raised there
+    with pytest.raises(sqlite3.OperationalError, match="no_such_table"):
+        tracker_db.get_setting("after")
+    # Raised once; the rest of the batch was applied
+    assert tracker_db.get_setting("after") == "1"
+    tracker_db.flush()
+
+
+def test_reads_dont_wait_for_other_sessions_writes(tracker_db):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_write():
+        started.set()
+        release.wait(5)
+        tracker_db.set_setting("slow", "1")
+
+    tracker_db.set_setting("slow", "0")
+    in_other_session(lambda: tracker_db.defer(slow_write))
+    assert started.wait(5)
+    try:
+        assert tracker_db.get_setting("slow") == "0"
+    finally:
+        release.set()
+    tracker_db.flush()
+    assert tracker_db.get_setting("slow") == "1"
+
+
+def test_abandoned_streaming_read_is_finished_before_release(tracker_db, monkeypatch):
+    for n in range(20):
+        tracker_db.add_daily_log(f"2026-01-{n + 1:02d}", ["Python"], "", 3)
+    release = tracker_db._release
+
+    def checked_release(path, conn):
+        # Fails with "database table is locked" while a SELECT on it is pending
+        conn.execute("DROP TABLE daily_logs")
+        release(path, conn)
+
+    monkeypatch.setattr(tracker_db, "_release", checked_release)
+    rows = tracker_db.iter_logs(("date",), chunk_size=5)
+    next(rows)
+    rows.close()
@@ -0,0 +1,8 @@
+"""One module per app.py page, each with a render() function."""
+import database as db
+import roadmap_index
+
+
+def current_plan():
+    """The learner's roadmap plan (set on the Settings page), compiled."""
+    return roadmap_index.get(db.get_setting("roadmap_plan"))
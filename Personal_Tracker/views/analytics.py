@@ -0,0 +1,116 @@
+"""Analytics page: activity heatmap, confidence trend, roadmap coverage, quiz item analysis and monthly reflections."""
+import datetime
+
+import altair as alt
+import streamlit as st
+import pandas as pd
+
+import analytics
+import database as db
+from views import current_plan
+
+# GitHub's dark-theme contribution colours, from no activity to the most
+HEATMAP_COLORS = ["#161B22", "#0E4429", "#006D32", "#26A641", "#39D353"]
+HEATMAP_METRICS = {"Topics covered": ("Topics", None), "Confidence": ("Confidence", [0, 5]),
+                   "Quiz score": ("Quiz %", [0, 100])}
+
+
+def activity_heatmap(today):
+    # The roadmap's whole span plus at least the last year, one column per week
+    start = today - datetime.timedelta(weeks=52)
+    end = today
+    roadmap_start = db.get_setting("roadmap_start_date")
+    if roadmap_start:
+        roadmap_start = datetime.date.fromisoformat(roadmap_start)
+        start = min(start, roadmap_start)
+        end = max(end, roadmap_start + datetime.timedelta(days=current_plan().total_days - 1))
+    start -= datetime.timedelta(days=start.weekday())
+
+    metric = st.radio("Shade by", list(HEATMAP_METRICS), horizontal=True, label_visibility="collapsed")
+    column, domain = HEATMAP_METRICS[metric]
+    calendar = analytics.activity_calendar(start.isoformat(), end.isoformat()).reset_index()
+    calendar["Date"] = calendar.pop("date").dt.strftime("%Y-%m-%d")
+    calendar["Shade"] = calendar[column].fillna(0)
+    domain = domain or [0, max(1, int(calendar["Shade"].max()))]
+
+    chart = alt.Chart(calendar).mark_rect(cornerRadius=2, stroke="#0E1117", strokeWidth=2).encode(
+        x=alt.X("Week:O", title=None, axis=alt.Axis(
+            labelAngle=0, ticks=False, domain=False,
+            labelExpr="utcdate(toDate(datum.value)) <= 7 ? utcFormat(toDate(datum.value), '%b') : ''")),
+        y=alt.Y("Weekday:O", title=None, sort=["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+                axis=alt.Axis(ticks=False, domain=False)),
+        color=alt.Color("Shade:Q", legend=None, scale=alt.Scale(range=HEATMAP_COLORS, domain=domain)),
+        tooltip=["Date", "Topics", "Confidence", alt.Tooltip("Quiz %:Q", format=".0f")],
+    ).properties(height=150)
+    st.altair_chart(chart, use_container_width=True)
+
+
+def render():
+    st.title("📊 Analytics & Reflections")
+    tab1, tab2 = st.tabs(["Charts", "Monthly Assessment"])
+    with tab1:
+        st.subheader("📅 Study Activity")
+        activity_heatmap(datetime.date.today())
+
+        st.subheader("Confidence Trend")
+        # Rolling averages and quiz scores, downsampled for long histories
+        trend = analytics.confidence_trend()
+        if not trend.empty:
+            st.line_chart(trend, color=["#58A6FF", "#1F6FEB", "#D29922"])
+            with st.expander("Weekly Summary"):
+                weekly = analytics.weekly_summary().tail(104).iloc[::-1]  # last two years, newest first
+                weekly.index = weekly.index.strftime("%Y-%m-%d")
+                st.dataframe(weekly, column_config={
+                    "Avg Confidence": st.column_config.NumberColumn(format="%.2f"),
+                    "Avg Quiz %": st.column_config.NumberColumn(format="%.0f%%")})
+        else:
+            st.info("Log some days to see your confidence trend.")
+    
+        st.subheader("Roadmap Coverage")
+        plan = current_plan()
+        coverage = db.get_topic_coverage(plan.all_topics)
+        st.metric("Topics Covered", f"{len(coverage)} / {len(plan.all_topics)}")
+        if coverage:
+            coverage_df = pd.DataFrame(coverage, columns=["Topic", "Times Covered", "First Covered", "Last Covered"])
+            coverage_df.insert(1, "Roadmap Day", [plan.days_for_topic(t)[0] for t, *_ in coverage])
+            st.dataframe(coverage_df.sort_values("Times Covered", ascending=False), hide_index=True)
+
+        st.subheader("Quiz Item Analysis")
+        by_difficulty = db.get_difficulty_stats()
+        if by_difficulty:
+            for col, difficulty in zip(st.columns(len(db.DIFFICULTIES)), db.DIFFICULTIES):
+                attempts, correct = by_difficulty.get(difficulty, (0, 0))
+                col.metric(f"{difficulty} Accuracy", f"{correct / attempts:.0%}" if attempts else "–",
+                           help=f"{correct} of {attempts} answers correct")
+            weakest = db.get_weakest_topics(5)
+            hardest = db.get_hardest_questions(10)
+            if weakest:
+                st.markdown("**Weakest Topics**")
+                weak_df = pd.DataFrame(weakest, columns=["Topic", "Answered", "Correct"])
+                weak_df["Accuracy"] = 100 * weak_df["Correct"] / weak_df["Answered"]
+                st.dataframe(weak_df, hide_index=True, column_config={
+                    "Accuracy": st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100)})
+            if hardest:
+                st.markdown("**Most Missed Questions**")
+                hard_df = pd.DataFrame([row[1:] for row in hardest],
+                                       columns=["Question", "Topic", "Difficulty", "Answered", "Correct"])
+                st.dataframe(hard_df, hide_index=True)
+        else:
+            st.info("Take a daily quiz to see which questions and topics trip you up.")
+    with tab2:
+        st.subheader("Monthly Reflection")
+        today = datetime.date.today()
+        current_month_str = today.strftime("%Y-%m")
+        month_input = st.text_input("Month (YYYY-MM)", value=current_month_str)
+        with st.form("assessment_form"):
+            reflection = st.text_area("Big Picture: What went well? What didn't?", height=150)
+            rating = st.slider("Overall Satisfaction", 1, 10, 5)
+            if st.form_submit_button("Save Assessment"):
+                db.add_monthly_assessment(month_input, reflection, rating)
+                st.rerun()
+        st.markdown("---")
+        st.subheader("Past Assessments")
+        assessments = db.iter_monthly_assessments(columns=("month_str", "reflection_text", "rating"))
+        for month_str, reflection_text, a_rating in assessments:
+            with st.expander(f"{month_str} - Rating: {a_rating}/10"):
+                st.write(reflection_text)
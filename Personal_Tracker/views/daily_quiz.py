@@ -0,0 +1,134 @@
+"""Daily Quiz page: up to 15 banked questions on the current week's topic."""
+import datetime
+
+import streamlit as st
+
+import database as db
+import instrumentation
+import quiz_engine
+import spaced_repetition
+from views import current_plan
+
+LEVELS = {
+    "Easy": "Level 1: Foundations (Easy)",
+    "Medium": "Level 2: Application (Medium)",
+    "Hard": "Level 3: Theory & Edge Cases (Hard)",
+}
+
+
+def render():
+    st.title("🧩 Daily Knowledge Check")
+
+    today_str = datetime.date.today().strftime("%Y-%m-%d")
+
+    # Check if we have determined a topic for today?
+    # Logic: Get current week from roadmap or use a placeholder topic based on Day of Week or random
+    # For now: Try to get the topic from current week in roadmap
+
+    roadmap_start = db.get_setting("roadmap_start_date")
+    topic_for_quiz = "Machine Learning" # Default
+    week_num = None
+
+    if roadmap_start:
+        start_date = datetime.datetime.strptime(roadmap_start, "%Y-%m-%d").date()
+        today = datetime.date.today()
+        days_diff = (today - start_date).days
+        plan = current_plan()
+        week_idx = max(0, min(days_diff // 7, plan.total_weeks - 1))
+        week_num = week_idx + 1
+        topic_for_quiz = plan.week_title(week_num, topic_for_quiz)
+
+    st.markdown(f"**Today's Topic**: {topic_for_quiz}")
+
+    # Check if quiz already taken
+    past_result = db.get_quiz_result(today_str)
+
+    if past_result:
+        # Show results
+        st.success(f"You have already completed today's quiz!")
+        st.metric("Your Score", f"{past_result[1]} / {past_result[2]}")
+        missed = [difficulty for _, _, difficulty, _, is_correct in db.get_quiz_answers(today_str) if not is_correct]
+        if missed:
+            st.caption("Missed: " + ", ".join(f"{missed.count(d)} {d}" for d in db.DIFFICULTIES if d in missed))
+    
+    else:
+        # Generate new quiz (store in session state so it doesn't reshuffle on re-render).
+        # Today's generated questions join the bank, then the quiz is drawn from
+        # everything banked for the topic (generated and curated). Options are
+        # shuffled as they're drawn, seeded by the date: the same all day, not
+        # the same as yesterday.
+        if "quiz_data" not in st.session_state:
+            with instrumentation.span("quiz", "generate_quiz"):
+                generated = quiz_engine.generate_quiz(topic_for_quiz)
+            db.add_questions(quiz_engine.to_bank_rows(topic_for_quiz, generated))
+            drawn = db.get_quiz_questions(topic_for_quiz, 5, seed=today_str)
+            st.session_state.quiz_data = quiz_engine.from_bank_rows(drawn, seed=today_str)
+            # Bank ids, so each answer can be logged against its question
+            st.session_state.quiz_ids = [row[0] for row in drawn]
+        
+        questions = st.session_state.quiz_data
+        question_ids = st.session_state.get("quiz_ids") or [None] * len(questions)
+    
+        with st.form("quiz_form"):
+            score = 0
+            user_answers = {}
+        
+            # Up to 5 per level, grouped by each question's own difficulty: a
+            # level the bank is short of gets fewer (or none)
+            for difficulty in db.DIFFICULTIES:
+                level = [i for i, q in enumerate(questions) if q.difficulty == difficulty]
+                if not level:
+                    continue
+                st.markdown(f"### {LEVELS[difficulty]}")
+                for i in level:
+                    q = questions[i]
+                    st.markdown(f"**{i+1}. {q.question}**")
+                    user_answers[i] = st.radio(f"Select answer for Q{i+1}", q.options, key=f"q{i}", label_visibility="collapsed")
+                    st.divider()
+            
+            submitted = st.form_submit_button("Submit Assessment")
+        
+            if submitted:
+                # Calculate score
+                total = len(questions)
+                answers = []
+                for i in range(total):
+                    is_correct = user_answers[i] == questions[i].answer
+                    score += is_correct
+                    answers.append((question_ids[i], topic_for_quiz, questions[i].difficulty, user_answers[i], is_correct))
+            
+                with db.transaction():
+                    db.add_quiz_result(today_str, score, total, topic_for_quiz)
+                    db.add_quiz_answers(today_str, answers)
+                    if week_num:
+                        spaced_repetition.review_quiz(today_str, plan, week_num, score, total)
+                st.session_state.quiz_score = score
+                st.rerun()
+
+    st.markdown("---")
+    with st.expander(f"🔎 Question Bank ({db.count_questions()} questions)"):
+        query = st.text_input("Search questions", placeholder="e.g. overfitting, gradient, week3")
+        if query:
+            results = db.search_questions(query, 20)
+            if not results:
+                st.info("No questions match.")
+            for _, q_topic, q_difficulty, q_text, q_options, q_answer, q_tags, _ in results:
+                st.markdown(f"**{q_text}**  \n*{q_topic} · {q_difficulty}{' · ' + q_tags if q_tags else ''}*")
+                st.caption("Options: " + " / ".join(q_options) + f" — Answer: {q_answer}")
+
+        with st.form("add_question_form", clear_on_submit=True):
+            st.markdown("**Add your own question**")
+            new_topic = st.text_input("Topic", value=topic_for_quiz)
+            new_difficulty = st.selectbox("Difficulty", db.DIFFICULTIES)
+            new_question = st.text_input("Question")
+            new_options = st.text_area("Options (one per line)")
+            new_answer = st.text_input("Correct answer (one of the options)")
+            new_tags = st.text_input("Tags (space-separated)")
+            if st.form_submit_button("Add to Bank"):
+                options = [o.strip() for o in new_options.splitlines() if o.strip()]
+                if not new_question.strip() or len(options) < 2 or new_answer.strip() not in options:
+                    st.error("A question needs text, at least two options and an answer that is one of them.")
+                else:
+                    db.add_questions([(new_topic, new_difficulty, new_question.strip(), options, new_answer.strip(), new_tags)],
+                                     source="curated")
+                    st.toast("Question added!", icon="✅")
@@ -0,0 +1,53 @@
+"""Dashboard page: streak, totals, topics due for revision and the most recent logs."""
+import datetime
+
+import streamlit as st
+
+import database as db
+import spaced_repetition
+
+
+def render():
+    st.title("👋 Welcome Back")
+
+    stats = db.get_analytics_stats()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Current Streak", f"{stats['current_streak']} Days", "🔥")
+    with col2:
+        st.metric("Total Logs", stats['total_logs'])
+    with col3:
+        st.metric("Avg Confidence", f"{stats['avg_confidence']}/5")
+    
+    st.markdown("---")
+    today_str = datetime.date.today().strftime("%Y-%m-%d")
+    st.subheader(f"🔁 Due for Revision ({db.count_due_revisions(today_str)})")
+    due = spaced_repetition.due(today_str, 5)
+    if due:
+        for topic, due_date, interval_days, _ in due:
+            overdue = (datetime.date.today() - datetime.date.fromisoformat(due_date)).days
+            st.markdown(f"- **{topic}** — " + (f"{overdue} day{'s' if overdue > 1 else ''} overdue" if overdue else "due today")
+                        + f" · last interval {interval_days}d")
+    else:
+        st.caption("Nothing due. Topics you log are scheduled for revision automatically.")
+
+    st.markdown("---")
+    st.subheader("Recent Activity")
+    logs = db.get_recent_logs(3)
+    if logs:
+        for log in logs: 
+            # New-style logs leave actual_learning (2) empty; fall back to the revision notes (6)
+            preview = log[2] or log[6] or ""
+            with st.container():
+                st.markdown(f"""
+                <div style="background-color: #161B22; padding: 15px; border-radius: 10px; border: 1px solid #30363D; margin-bottom: 10px;">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <h4 style="margin: 0; color: #58A6FF;">{log[0]}</h4>
+                        <span style="background-color: #238636; color: white; padding: 2px 8px; border-radius: 10px; font-size: 12px;">Score: {log[3]}/5</span>
+                    </div>
+                    <p style="color: #8B949E; margin-top: 5px; font-size: 14px;">{preview[:100]}...</p>
+                </div>
+                """, unsafe_allow_html=True)
+    else:
+        st.info("No logs yet. Start your journey in the 'Log Progress' tab.")
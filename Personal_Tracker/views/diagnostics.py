@@ -0,0 +1,30 @@
+"""Diagnostics page: tracing switch and recorded timings."""
+import streamlit as st
+import pandas as pd
+
+import database as db
+import instrumentation
+
+
+def render():
+    st.title("🩺 Diagnostics")
+    st.caption("Query, page and quiz timings recorded while tracing is on. Applies to the whole app process.")
+    trace_on = st.toggle("Enable tracing", value=instrumentation.ENABLED)
+    if instrumentation.TRACE_FILE:
+        st.caption(f"Records are also appended to `{instrumentation.TRACE_FILE}` (TRACKER_TRACE_FILE).")
+    if trace_on != instrumentation.ENABLED:
+        # The JSONL file only ever comes from the environment, never the page
+        db.set_tracing(trace_on, instrumentation.TRACE_FILE)
+        st.rerun()
+    if st.button("Clear Records"):
+        instrumentation.clear()
+        st.rerun()
+    
+    for kind, label in [("query", "Slowest Queries"), ("page", "Page Renders"), ("quiz", "Quiz Generation")]:
+        st.subheader(label)
+        rows = instrumentation.summary(kind)
+        if rows:
+            df = pd.DataFrame(rows)[["name", "count", "total_ms", "mean_ms", "max_ms", "rows"]]
+            st.dataframe(df.round(3), hide_index=True)
+        else:
+            st.info("Nothing recorded yet." if instrumentation.ENABLED else "Tracing is off.")
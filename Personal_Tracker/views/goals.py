@@ -0,0 +1,94 @@
+"""Goals page: the selected week's roadmap goals and recent learning history."""
+import datetime
+
+import streamlit as st
+
+import database as db
+from views import current_plan
+
+
+def render():
+    st.title("🎯 Weekly Targets")
+    roadmap_start = db.get_setting("roadmap_start_date")
+    if not roadmap_start:
+        st.warning("Roadmap not initialized. Go to Settings.")
+    else:
+        start_date = datetime.datetime.strptime(roadmap_start, "%Y-%m-%d").date()
+        plan = current_plan()
+        today = datetime.date.today()
+        week_options = []
+        for i in range(plan.total_weeks):
+            w_start = start_date + datetime.timedelta(weeks=i)
+            week_options.append(f"Week {i+1}: {w_start.strftime('%b %d')}")
+        days_diff = (today - start_date).days
+        current_week_idx = max(0, min(days_diff // 7, plan.total_weeks - 1))
+    
+        selected_week_str = st.selectbox("Select Week", week_options, index=current_week_idx)
+        selected_week_idx = week_options.index(selected_week_str)
+        view_start_date = start_date + datetime.timedelta(weeks=selected_week_idx)
+        view_start_str = view_start_date.strftime("%Y-%m-%d")
+    
+        st.markdown(f"**Focus**: {plan.week_title(selected_week_idx+1, 'Unknown')}")
+        goals = db.get_weekly_goals(view_start_str)
+    
+        if goals:
+            completed_count = sum(1 for g in goals if g[3])
+            progress = completed_count / len(goals)
+            st.progress(progress, text=f"Progress: {int(progress*100)}%")
+            for goal in goals:
+                g_id, _, text, is_done, _, day_num = goal
+            
+                # Style enhancement for Special Days (roadmap goals carry their day number)
+                icon = "📄"
+                extra_style = ""
+                day = plan.day(day_num) if day_num else None
+                if day and day.kind == "revision":
+                    icon = "🔁" # Revision
+                    extra_style = "border-left: 3px solid #d29922;"
+                elif day and day.kind == "project":
+                    icon = "🛠️" # Project
+                    extra_style = "border-left: 3px solid #8957e5;"
+
+                col1, col2 = st.columns([0.1, 9])
+                with col1:
+                    is_checked = st.checkbox("", value=bool(is_done), key=f"goal_{g_id}")
+                    if is_checked != bool(is_done):
+                        db.defer(db.toggle_goal_complete, g_id, is_done)
+                        st.rerun()
+                with col2:
+                    content_html = f"<span>{icon} {text}</span>"
+                    if is_done:
+                        content_html = f"<span style='color: #8b949e; text-decoration: line-through;'>{icon} {text}</span>"
+                
+                    if extra_style:
+                         st.markdown(f"<div style='padding-left: 10px; {extra_style}'>{content_html}</div>", unsafe_allow_html=True)
+                    else:
+                         st.markdown(content_html, unsafe_allow_html=True)
+        else:
+            st.info("No goals found for this week.")
+        
+    st.markdown("---")
+    with st.expander("📅 Daily Learning History (Special Section)", expanded=True):
+        st.write("Recent daily logs:")
+        recent_logs = db.get_recent_logs(7) # Show last 7
+        if recent_logs:
+            topics_by_date = db.get_topics_for_dates([log[0] for log in recent_logs])
+            for log in recent_logs:
+                # 0=date, 6=revise
+                date = log[0]
+                topics = topics_by_date.get(date, [])
+                revision = ""
+                # Handle potential missing columns for old logs if query returned *
+                if len(log) > 6 and log[6]:
+                    revision = log[6]
+                
+                st.markdown(f"**{date}**")
+                if topics:
+                    st.markdown("*Learned:*")
+                    for t in topics:
+                        st.markdown(f"- {t}")
+                if revision:
+                    st.markdown(f"*To Revise:* {revision}")
+                st.divider()
+        else:
+            st.info("No logs yet.")
@@ -0,0 +1,112 @@
+"""Log Progress page: the day's roadmap topics, revision notes and confidence."""
+import datetime
+
+import streamlit as st
+
+import database as db
+import roadmap_index
+import spaced_repetition
+from views import current_plan
+
+
+def render():
+    st.title("✍️ Daily Focus")
+    selected_date = st.date_input("Date", datetime.date.today(), label_visibility="hidden")
+    date_str = selected_date.strftime("%Y-%m-%d")
+
+    # Fetch existing log
+    existing_log = db.get_daily_log(date_str)
+    # Indices: 0=date, 1=plan(old), 2=actual(old), 3=conf, 4=created, 5=topics(new), 6=revision(new)
+
+    default_topics = []
+    default_revision = ""
+    default_confidence = 3
+
+    if existing_log:
+        default_confidence = existing_log[3]
+        default_topics = db.get_log_topics(date_str)
+        if len(existing_log) > 6 and existing_log[6]:
+            default_revision = existing_log[6]
+
+    # Roadmap / Goals Logic
+    roadmap_start = db.get_setting("roadmap_start_date")
+    current_day_topics = []
+    day = None
+
+    if roadmap_start:
+        start_date = datetime.datetime.strptime(roadmap_start, "%Y-%m-%d").date()
+        # Find which Day Number (1-based)
+        day_num = roadmap_index.day_number(start_date, selected_date)
+        plan = current_plan()
+        day = plan.day(day_num)
+    
+        if day:
+            current_day_topics = day.topics
+            st.caption(f"**Day {day_num}: {day.title}**")
+        else:
+            if day_num < 1:
+                st.info("Selected date is before the roadmap start.")
+            else:
+                st.info(f"Congratulations! You have passed the {plan.total_days}-day roadmap.")
+
+    with st.form("daily_log_form"):
+        st.markdown("### 📚 Daily Learning")
+    
+        selected_topics = []
+        if current_day_topics:
+            st.caption("Select topics learned today:")
+            for i, topic in enumerate(current_day_topics):
+                # Check if this topic is in default_topics
+                is_checked = topic in default_topics
+                if st.checkbox(topic, value=is_checked, key=f"topic_{i}"):
+                    selected_topics.append(topic)
+        else:
+            if not roadmap_start:
+                st.info("Roadmap not initialized. Go to Settings.")
+            else:
+                 st.info("No specific topics found for this day (Rest day or outside range).")
+
+        st.markdown("### 🔄 Topics to Revise")
+        revision_notes = st.text_area("Enter topics/sub-topics to revise", value=default_revision, height=100)
+
+        # Topics the revision schedule says are due, most overdue first
+        revised_topics = []
+        due = [row for row in spaced_repetition.due(date_str, 10) if row[0] not in current_day_topics]
+        if due:
+            st.caption("Due for revision — tick what you revised:")
+            for i, (topic, due_date, _, _) in enumerate(due):
+                label = topic if due_date == date_str else f"{topic} (due {due_date})"
+                if st.checkbox(label, key=f"revise_{i}"):
+                    revised_topics.append(topic)
+    
+        # --- SATURDAY SPECIAL SLOT ---
+        # Check if it is Day 6 of the week
+        if day and day.kind == "revision":
+            st.markdown("---")
+            st.markdown("### 🔁 Saturday Weekly Revision")
+            st.info("It's Saturday! Time to review everything you learned this week.")
+        
+            # Fetch topics for Day 1 to Day 5 of this week
+            # Current date is Day 6. Day 1 is 5 days ago.
+            # day_num is 6. day_num-1=5 (Friday), day_num-5=1 (Monday)
+            # So we look back 1 to 5 days, in one range query.
+            week_start_str = (selected_date - datetime.timedelta(days=5)).strftime("%Y-%m-%d")
+            week_end_str = (selected_date - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+            topics_to_review = db.get_topics_between(week_start_str, week_end_str) # unique topics
+        
+            if topics_to_review:
+                with st.expander("� Topics added this week", expanded=True):
+                    for t in topics_to_review:
+                        st.markdown(f"- {t}")
+                st.caption("Use the 'Topics to Revise' box above to note down any struggles.")
+            else:
+                st.warning("No learning logs found for this week yet.")
+
+        st.markdown("### �🔋 Energy")
+        confidence_score = st.slider("", 1, 5, value=default_confidence)
+    
+        if st.form_submit_button("Save Entry"):
+            with db.transaction():
+                db.add_daily_log(date_str, selected_topics, revision_notes, confidence_score)
+                spaced_repetition.review_log(date_str, selected_topics + revised_topics, confidence_score, current_plan())
+            st.toast(f"Entry saved!", icon="✅")
@@ -0,0 +1,91 @@
+"""Projects page: the roadmap's portfolio projects plus custom ones."""
+import datetime
+
+import streamlit as st
+
+import database as db
+import roadmap_index
+from views import current_plan
+
+
+def render():
+    st.title("🚀 Portfolio Projects")
+
+    # 1. Fetch Key Data
+    roadmap_start = db.get_setting("roadmap_start_date")
+    current_day_num = 0
+    if roadmap_start:
+        start_date = datetime.datetime.strptime(roadmap_start, "%Y-%m-%d").date()
+        today = datetime.date.today()
+        current_day_num = roadmap_index.day_number(start_date, today)
+
+    # 2. defined projects
+    defined_projects = current_plan().projects
+
+    # 3. Tracked state of each roadmap project (matched and given a status in one query):
+    # (day, project id or None, status, link)
+    tracked = db.get_roadmap_projects([(day, p["title"]) for day, p in defined_projects.items()], current_day_num)
+
+    st.caption("Track your hands-on journey. Projects are unlocked as you progress.")
+
+    # Display Logic
+    for r_day, p_id, status, link in tracked:
+        p_def = defined_projects[r_day]
+        title = p_def["title"]
+        desc = p_def["description"]
+        features = p_def["features"]
+        link = link or ""
+
+        # UI Rendering
+        with st.expander(f"{title}  [{status}]", expanded=(status in ["In Progress", "Missing"])):
+            st.markdown(f"**Goal (Day {r_day})**: {desc}")
+        
+            st.markdown("#### 🔑 Key Features to Build")
+            for f in features:
+                st.markdown(f"- {f}")
+        
+            st.markdown("---")
+        
+            # Interactive Section
+            if p_id:
+                # Update Existing
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    new_link = st.text_input("Project Link (GitHub/Demo)", value=link, key=f"lnk_{r_day}")
+                with col2:
+                    new_status = st.selectbox("Status", ["Not Started", "In Progress", "Done"], index=["Not Started", "In Progress", "Done"].index(status) if status in ["Not Started", "In Progress", "Done"] else 0, key=f"st_{r_day}")
+            
+                if st.button("Update Project", key=f"btn_{r_day}"):
+                    db.defer(db.update_project, p_id, new_status, new_link)
+                    st.toast("Project updated!")
+                    st.rerun()
+            else:
+                # Create New Entry Logic
+                if status == "Upcoming":
+                    st.info(f"This project is scheduled for Day {r_day}. You are on Day {current_day_num}.")
+                else:
+                    st.warning("You haven't tracked this project yet.")
+                    col1, col2 = st.columns([3, 1])
+                    with col1:
+                        new_link = st.text_input("Project Link (GitHub/Demo)", key=f"lnk_{r_day}")
+                    with col2:
+                        new_status = st.selectbox("Status", ["Not Started", "In Progress", "Done"], key=f"st_{r_day}")
+                    
+                    if st.button("Start Tracking", key=f"btn_new_{r_day}"):
+                         if db.add_project(title, desc, new_status, new_link, r_day):
+                             st.toast("Project created!")
+                         else:
+                             st.toast("This project is already tracked.")
+                         st.rerun()
+
+    # Generic/Custom Projects Section
+    st.markdown("---")
+    with st.expander("➕ Add Custom Project (Extra Credit)"):
+        with st.form("new_custom_project"):
+            c_name = st.text_input("Project Name")
+            c_desc = st.text_area("Description")
+            c_link = st.text_input("Link")
+            c_stat = st.selectbox("Status", ["Not Started", "In Progress", "Done"])
+            if st.form_submit_button("Add Custom Project"):
+                db.add_project(c_name, c_desc, c_stat, c_link)
+                st.rerun()
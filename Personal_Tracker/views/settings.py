@@ -0,0 +1,66 @@
+"""Settings page: roadmap generation and maintenance."""
+import datetime
+
+import streamlit as st
+
+import database as db
+import quiz_engine
+import roadmap_index
+import spaced_repetition
+from views import current_plan
+
+
+def initialize_roadmap(start_date, plan):
+    # Roadmap goals are upserted on their day number, so pressing the button
+    # again (even with a new start date) moves each day's goal to its week
+    # and keeps completed goals completed.
+    goals = []
+    for day in plan.days[1:]:
+        week_start = start_date + datetime.timedelta(weeks=day.week-1)
+        # Goal text concept: "Day X: Title"; the day number is stored alongside
+        goals.append((week_start.strftime("%Y-%m-%d"), f"Day {day.number}: {day.title}", day.number))
+    
+    with db.transaction():
+        # Switching plans replaces the old plan's goals; custom goals stay.
+        # The same plan only loses days it no longer has.
+        db.delete_roadmap_goals(0 if plan.id != current_plan().id else plan.total_days)
+        db.add_weekly_goals(goals)
+        db.set_setting("roadmap_start_date", start_date.strftime("%Y-%m-%d"))
+        db.set_setting("roadmap_plan", plan.id)
+        # Bank a quiz for every week and day title, searchable by "weekN" / "dayN".
+        # Titles already banked (e.g. by an earlier press) are skipped, so
+        # regenerating doesn't rebuild and re-offer hundreds of quizzes.
+        titles = [(plan.week_title(w), f"week{w}") for w in range(1, plan.total_weeks + 1)]
+        titles += [(day.title, f"day{day.number} week{day.week}") for day in plan.days[1:]]
+        banked = db.get_banked_topics([title for title, _ in titles])
+        titles = [(title, tags) for title, tags in titles if title not in banked]
+        quizzes = quiz_engine.generate_quizzes([title for title, _ in titles])
+        db.add_questions(row for title, tags in titles for row in quiz_engine.to_bank_rows(title, quizzes[title], tags))
+
+
+def render():
+    st.title("⚙️ Settings")
+    st.write("Roadmap Automation")
+    plans = {p.id: p for p in roadmap_index.plans()}
+    current = current_plan()
+    plan_id = st.selectbox("Learning Plan", list(plans), index=list(plans).index(current.id),
+                           format_func=lambda i: f"{plans[i].title} ({plans[i].total_days} days)")
+    plan = plans[plan_id]
+    if plan.description:
+        st.caption(plan.description)
+    today = datetime.date.today()
+    last_monday = today - datetime.timedelta(days=today.weekday())
+    start_date_input = st.date_input("Course Start Date (Monday)", last_monday)
+    if plan.id != current.id and db.get_setting("roadmap_start_date"):
+        st.warning(f"Generating will replace the goals of '{current.title}' (and their completion) with this plan's.")
+    if st.button("Generate/Reset Roadmap"):
+        with st.spinner(f"Generating {plan.total_weeks}-week plan..."):
+            initialize_roadmap(start_date_input, plan)
+        st.success("Roadmap generated! Check the 'Goals' tab.")
+
+    st.markdown("---")
+    st.write("Maintenance")
+    if st.button("Rebuild Dashboard Statistics"):
+        db.rebuild_stats()
+        spaced_repetition.rebuild(current_plan())
+        st.success("Statistics and the revision schedule recomputed from your logs, quizzes and projects.")